@@ -1,15 +1,35 @@
 # mcpo_control_panel/__main__.py
 
 import argparse
+import atexit
 import os
 from pathlib import Path
+import queue
 import sys
 import logging
+import logging.handlers
 
 # Configure basic logger to see outputs before uvicorn setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def route_root_logging_through_queue():
+    """
+    Moves the root logger's handlers behind a QueueHandler/QueueListener pair, so request
+    handlers only enqueue records and the stream/file writes happen on the listener thread.
+    """
+    root_logger = logging.getLogger()
+    handlers = root_logger.handlers[:]
+    if not handlers:
+        return
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    for handler in handlers:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener.start()
+    atexit.register(listener.stop) # Flushes queued records on interpreter exit
+
 def setup_environment_and_parse_args():
     parser = argparse.ArgumentParser(description="Run the MCPO Manager UI.")
     parser.add_argument(
@@ -35,6 +55,26 @@ def setup_environment_and_parse_args():
         action="store_true",
         help="Enable auto-reload (for development).",
     )
+    parser.add_argument(
+        "--loop",
+        type=str,
+        choices=["auto", "asyncio", "uvloop"],
+        default=os.getenv("MCPO_MANAGER_LOOP", "auto"),
+        help="Event loop implementation ('auto' uses uvloop when installed).",
+    )
+    parser.add_argument(
+        "--http",
+        type=str,
+        choices=["auto", "h11", "httptools"],
+        default=os.getenv("MCPO_MANAGER_HTTP", "auto"),
+        help="HTTP protocol implementation ('auto' uses httptools when installed).",
+    )
+    parser.add_argument(
+        "--access-log",
+        action=argparse.BooleanOptionalAction,
+        default=os.getenv("MCPO_MANAGER_ACCESS_LOG", "true").lower() not in ("0", "false", "no"),
+        help="Enable or disable the Uvicorn access log (--no-access-log silences the status/log polling requests).",
+    )
     parser.add_argument(
         "--config-dir",
         type=str,
@@ -74,18 +114,25 @@ def setup_environment_and_parse_args():
 def main():
     """Main function to run the application."""
     cli_args = setup_environment_and_parse_args()
+    route_root_logging_through_queue()
 
     # Now that environment variables are set, import uvicorn and app
     import uvicorn
     from .main import app # Import FastAPI app object
 
-    logger.info(f"Starting Uvicorn with host={cli_args.host}, port={cli_args.port}...")
+    logger.info(
+        f"Starting Uvicorn with host={cli_args.host}, port={cli_args.port}, "
+        f"loop={cli_args.loop}, http={cli_args.http}..."
+    )
     uvicorn.run(
         app, # Pass the app object
         host=cli_args.host,
         port=cli_args.port,
         workers=cli_args.workers,
         reload=cli_args.reload,
+        loop=cli_args.loop,
+        http=cli_args.http,
+        access_log=cli_args.access_log,
         # log_level="info" # Can configure uvicorn log level separately
     )
 
@@ -10,9 +10,11 @@ from fastapi.responses import HTMLResponse, PlainTextResponse
 from sqlmodel import Session
 from fastapi.templating import Jinja2Templates
 from fastapi import Form
+from starlette.concurrency import run_in_threadpool
 
 import os 
-import json # Moved import to top
+import json
+import orjson
 
 from ..db.database import get_session
 from ..services import mcpo_service, config_service
@@ -36,7 +38,7 @@ async def start_mcpo_process(
     if not templates: raise HTTPException(500, "Templates not configured")
 
     if not settings.manual_config_mode_enabled:
-        if not config_service.generate_mcpo_config_file(db, settings):
+        if not await run_in_threadpool(config_service.generate_mcpo_config_file, db, settings):
             error_message = "Failed to generate standard MCPO configuration file."
             logger.error(error_message)
             return templates.TemplateResponse(
@@ -45,7 +47,7 @@ async def start_mcpo_process(
                 status_code=500
             )
     else:
-        config_service.generate_mcpo_config_file(db, settings)
+        await run_in_threadpool(config_service.generate_mcpo_config_file, db, settings)
 
 
     success, message = await mcpo_service.start_mcpo(settings)
@@ -68,6 +70,13 @@ async def stop_mcpo_process(request: Request):
     )
 
 
+@router.post("/health-check/resume")
+async def resume_health_check():
+    logger.info("API call: Resume MCPO health check")
+    mcpo_service.resume_health_check()
+    return {"message": "Health check resumed."}
+
+
 @router.post("/restart", response_class=HTMLResponse)
 async def restart_mcpo_process(
     request: Request,
@@ -99,7 +108,7 @@ async def get_mcpo_process_logs_html(
     lines: int = 100,
     settings: McpoSettings = Depends(get_mcpo_settings_dependency)
 ):
-    logger.debug(f"API call: Get MCPO logs HTML (last {lines} lines)")
+    logger.debug("API call: Get MCPO logs HTML (last %s lines)", lines)
     if not templates: raise HTTPException(500, "Templates not configured")
     if not settings.log_file_path:
         return HTMLResponse("<pre><code>Log file path not configured.</code></pre>")
@@ -116,7 +125,7 @@ async def get_mcpo_process_logs_html_fragment(
     lines: int = 200,
     settings: McpoSettings = Depends(get_mcpo_settings_dependency)
 ):
-    logger.debug(f"API call (HTMX): Get MCPO logs HTML fragment (last {lines} lines)")
+    logger.debug("API call (HTMX): Get MCPO logs HTML fragment (last %s lines)", lines)
 
     if not settings.log_file_path:
         logger.warning("API call (HTMX): Log file path not configured.")
@@ -142,6 +151,40 @@ async def get_mcpo_process_logs_html_fragment(
         logger.error(f"API call (HTMX): Error reading log file '{settings.log_file_path}': {e}", exc_info=True)
         return HTMLResponse(f"Error reading log file: {html.escape(str(e))}")
 
+@router.get("/logs/tail", response_class=HTMLResponse, name="api_get_logs_tail_html")
+async def get_mcpo_process_logs_tail_fragment(
+    offset: Optional[int] = None,
+    lines: int = 200,
+    settings: McpoSettings = Depends(get_mcpo_settings_dependency)
+):
+    """
+    Incremental variant of /logs/content for HTMX polling. The X-Log-Offset response header is
+    the offset to send with the next poll; HX-Reswap tells HTMX whether to append the new lines
+    or replace the block (first load, truncated file, errors).
+    """
+    logger.debug("API call (HTMX): Get MCPO log tail since offset %s", offset)
+    replace_headers = {"HX-Reswap": "innerHTML", "X-Log-Offset": "0"}
+
+    if not settings.log_file_path:
+        return HTMLResponse("Log file path not configured.", headers=replace_headers)
+    if not mcpo_service.path_exists_cached(settings.log_file_path):
+        return HTMLResponse(f"Log file not found: {html.escape(settings.log_file_path)}", headers=replace_headers)
+
+    log_lines, next_offset, reset = await mcpo_service.get_mcpo_log_increment(offset, lines, settings.log_file_path)
+    headers = {"X-Log-Offset": str(next_offset)}
+    if reset:
+        headers["HX-Reswap"] = "innerHTML"
+        if log_lines and log_lines[0].startswith("Error:"):
+            content = html.escape("\n".join(log_lines))
+        elif log_lines:
+            content = "<br>".join(map(html.escape, log_lines))
+        else:
+            content = "Log file is empty."
+    else:
+        headers["HX-Reswap"] = "beforeend"
+        content = "".join("<br>" + html.escape(line) for line in log_lines)
+    return HTMLResponse(content=content, headers=headers)
+
 @router.get("/generated-config", response_class=PlainTextResponse, name="get_generated_mcpo_config_content")
 async def get_generated_mcpo_config_content_api( 
     settings: McpoSettings = Depends(get_mcpo_settings_dependency)
@@ -198,14 +241,18 @@ async def set_manual_config_content_api(
     
     if not content_to_save:
         logger.info("Manual config content is empty. Saving default empty JSON object: {}")
-        content_to_save = json.dumps({"mcpServers": {}}, indent=2)
+        content_to_save = orjson.dumps({"mcpServers": {}}, option=orjson.OPT_INDENT_2).decode("utf-8")
     else:
         try:
-            parsed_json = json.loads(content_to_save)
-            content_to_save = json.dumps(parsed_json, indent=2)
-        except json.JSONDecodeError as json_e:
-            logger.warning(f"Invalid JSON content provided for manual config: {json_e}. Content: '{content_to_validate[:200]}...'")
-            raise HTTPException(status_code=400, detail=f"Invalid JSON format: {json_e}")
+            parsed_json = orjson.loads(content_to_save)
+            content_to_save = orjson.dumps(parsed_json, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity and integers wider than 64 bits, which json accepts; keep accepting them here
+            try:
+                content_to_save = json.dumps(json.loads(content_to_save), indent=2)
+            except json.JSONDecodeError as json_e:
+                logger.warning(f"Invalid JSON content provided for manual config: {json_e}. Content: '{content_to_validate[:200]}...'")
+                raise HTTPException(status_code=400, detail=f"Invalid JSON format: {json_e}")
 
     try:
         config_dir = os.path.dirname(config_path)
@@ -249,7 +296,9 @@ async def get_generated_mcpo_config_content_windows_api(
             return PlainTextResponse(content=f"// Error reading manual config file for Windows download.", status_code=500)
 
     try:
-        windows_config_content = config_service.generate_mcpo_config_content_for_windows(db, settings)
+        windows_config_content = await run_in_threadpool(
+            config_service.generate_mcpo_config_content_for_windows, db, settings
+        )
         if windows_config_content.startswith("// Error generating Windows config:"):
             logger.error(f"Error generating Windows config: {windows_config_content}")
             return PlainTextResponse(content=windows_config_content, status_code=500)
@@ -267,7 +316,8 @@ async def get_settings(settings: McpoSettings = Depends(get_mcpo_settings_depend
 @router.post("/settings", response_model=McpoSettings)
 async def update_settings(new_settings_payload: McpoSettings):
     logger.info("API call: POST /settings (Update all settings)")
-    if config_service.save_mcpo_settings(new_settings_payload):
+    if await run_in_threadpool(config_service.save_mcpo_settings, new_settings_payload):
+        mcpo_service.wake_health_check()
         return new_settings_payload
     else:
         raise HTTPException(status_code=500, detail="Failed to save MCPO settings.")
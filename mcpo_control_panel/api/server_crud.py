@@ -7,10 +7,10 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import HTMLResponse, Response
 from sqlmodel import Session
 from fastapi.templating import Jinja2Templates
+from starlette.concurrency import run_in_threadpool
 
 from ..db.database import get_session
 from ..services import config_service
-from ..models.server_definition import ServerDefinitionRead
 
 # Logger setup
 logger = logging.getLogger(__name__)
@@ -31,19 +31,18 @@ async def toggle_server(
     """
     Toggles the is_enabled flag for a server and returns the updated table row (HTML).
     """
-    logger.info(f"API Request: POST /api/servers/{server_id}/toggle")
+    logger.info("API Request: POST /api/servers/%s/toggle", server_id)
     if not templates:
         raise HTTPException(status_code=500, detail="Templates not configured for API router")
 
-    updated_definition = config_service.toggle_server_enabled(db, server_id)
+    updated_definition = await run_in_threadpool(config_service.toggle_server_enabled, db, server_id)
     if not updated_definition:
         raise HTTPException(status_code=404, detail="Server definition not found")
 
-    definition_read = ServerDefinitionRead.model_validate(updated_definition)
-
+    # The row template only reads attributes, so the ORM row is passed as-is (same as the index page)
     return templates.TemplateResponse(
         "_server_row.html",
-        {"request": request, "server": definition_read}
+        {"request": request, "server": updated_definition}
     )
 
 @router.delete("/{server_id}", status_code=200)
@@ -54,8 +53,8 @@ async def delete_server(
     """
     Deletes a server definition. Returns an empty response.
     """
-    logger.info(f"API Request: DELETE /api/servers/{server_id}")
-    deleted = config_service.delete_server_definition(db, server_id)
+    logger.info("API Request: DELETE /api/servers/%s", server_id)
+    deleted = await run_in_threadpool(config_service.delete_server_definition, db, server_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Server definition not found")
 
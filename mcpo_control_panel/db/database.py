@@ -3,6 +3,7 @@
 # ================================================
 import os
 from pathlib import Path # Added Path
+from sqlalchemy import event
 from sqlmodel import create_engine, Session, SQLModel
 from dotenv import load_dotenv
 import logging
@@ -55,7 +56,46 @@ DATABASE_URL = get_database_url()
 
 # SQLite-specific connect_args to allow session use from different threads
 # The engine should be created with the dynamically determined DATABASE_URL
-engine = create_engine(DATABASE_URL, echo=True, connect_args={"check_same_thread": False})
+# Pool sized for the threadpool-offloaded request handlers; SQLite needs no pre-ping or recycling
+DB_POOL_SIZE = int(os.getenv("MCPO_MANAGER_DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("MCPO_MANAGER_DB_MAX_OVERFLOW", "20"))
+engine = create_engine(
+    DATABASE_URL, echo=True, connect_args={"check_same_thread": False},
+    pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW, pool_pre_ping=False,
+)
+
+def _apply_sqlite_pragmas(dbapi_connection):
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+    finally:
+        cursor.close()
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """WAL lets readers proceed during a write; synchronous=NORMAL is durable under WAL and skips an fsync per commit."""
+    _apply_sqlite_pragmas(dbapi_connection)
+
+# Used only by the batched DB worker in mcpo_service, which runs one batch at a time on a single connection.
+# Its sessions control the transaction themselves so SAVEPOINT / Session.begin_nested() work;
+# the request-handling engine above keeps pysqlite's default transaction handling.
+batch_engine = create_engine(
+    DATABASE_URL, echo=True, connect_args={"check_same_thread": False},
+    pool_size=1, max_overflow=0, pool_pre_ping=False,
+)
+
+@event.listens_for(batch_engine, "connect")
+def _set_batch_sqlite_pragmas(dbapi_connection, connection_record):
+    """Same pragmas as the main engine, with pysqlite's implicit BEGIN turned off (emitted in _begin_batch_transaction)."""
+    dbapi_connection.isolation_level = None
+    _apply_sqlite_pragmas(dbapi_connection)
+
+@event.listens_for(batch_engine, "begin")
+def _begin_batch_transaction(conn):
+    # IMMEDIATE takes the write lock up front, so an op that reads and then writes can't hit
+    # "database is locked" when another connection commits in between; other writers wait on the busy timeout
+    conn.exec_driver_sql("BEGIN IMMEDIATE")
 
 def create_db_and_tables():
     """
@@ -5,6 +5,7 @@
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
@@ -14,7 +15,7 @@ import asyncio
 from typing import Optional, AsyncGenerator
 from sqlmodel import Session
 
-from .db.database import create_db_and_tables, get_session, engine
+from .db.database import create_db_and_tables, engine
 from .ui import routes as ui_router_module  # Imports the aggregator from mcpo_control_panel/ui/routes.py
 from .api import mcpo_control as mcpo_api_router
 from .api import server_crud as server_api_router
@@ -71,8 +72,9 @@ async def lifespan(app: FastAPI):
              else:
                  logger.error(f"Failed to start MCPO process during lifespan startup: {start_message}")
 
+        mcpo_service.open_http_client()
         # Start the Health Check background task *after* attempting to start MCPO
-        health_check_task = asyncio.create_task(mcpo_service.run_health_check_loop_async(get_session))
+        health_check_task = asyncio.create_task(mcpo_service.run_health_check_loop_async())
         logger.info("Health Check background task for MCPO started.")
 
     except Exception as startup_e:
@@ -107,11 +109,15 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error during MCPO server stop on shutdown: {e}", exc_info=True)
 
+    await mcpo_service.stop_db_worker()
+    await mcpo_service.close_http_client()
+
     logger.info("MCP Manager UI lifespan finished.")
 
 app = FastAPI(
     title="MCP Manager UI",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse, # JSON API routes serialise with orjson instead of stdlib json
     root_path=mcpo_global_settings.root_path if mcpo_global_settings else ""
 )
 app.add_middleware(ProxyHeadersMiddleware, trusted_hosts="*")
@@ -139,6 +145,7 @@ except RuntimeError as e:
 templates = Jinja2Templates(directory=str(templates_dir_path))
 import datetime
 templates.env.globals['now'] = datetime.datetime.utcnow
+ui_router_module.configure_templates(templates)
 
 # Pass templates to routers
 ui_router_module.set_templates_for_ui_routers(templates) # For the aggregated UI router
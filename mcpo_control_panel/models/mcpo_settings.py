@@ -54,6 +54,14 @@ class McpoSettings(BaseModel):
         default=5,
         description="Delay between failed check attempts (in seconds, min: 1)"
     )
+    health_check_backoff_base: float = Field(
+        default=1.3,
+        description="Multiplier applied to the failure delay after each consecutive failed check (1.0 disables backoff)"
+    )
+    health_check_max_backoff_seconds: PositiveInt = Field(
+        default=60,
+        description="Upper bound for the backed-off delay between failed checks (in seconds)"
+    )
     auto_restart_on_failure: bool = Field(
         default=True,
         description="Automatically restart mcpo after specified number of failed checks"
@@ -104,6 +112,13 @@ class McpoSettings(BaseModel):
             raise ValueError('Delay between failed checks must be at least 1 second.')
         return value
 
+    @field_validator('health_check_backoff_base')
+    @classmethod
+    def check_health_backoff_base(cls, value: float) -> float:
+        if not (1.0 <= value <= 10.0):
+            raise ValueError('Backoff factor must be between 1.0 and 10.0.')
+        return value
+
     @field_validator('public_base_url')
     @classmethod
     def check_public_base_url(cls, value: Optional[str]) -> Optional[str]:
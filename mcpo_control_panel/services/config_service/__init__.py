@@ -2,8 +2,11 @@
 from .settings_manager import load_mcpo_settings, save_mcpo_settings
 from .definition_manager import (
     create_server_definition,
+    create_server_definitions_bulk,
+    get_existing_server_names,
     get_server_definition,
     get_server_definitions,
+    count_server_definitions,
     update_server_definition,
     delete_server_definition,
     toggle_server_enabled,
@@ -12,21 +15,26 @@ from .file_generator import (
     generate_mcpo_config_file,
     generate_mcpo_config_content_for_windows,
     analyze_bulk_server_definitions,
-    # If _deadapt_windows_command or _extract_servers_from_json are needed externally:
-    # _deadapt_windows_command,
+    # If _extract_servers_from_json is needed externally:
     # _extract_servers_from_json,
 )
+from .server_fields import normalize_server_fields, deadapt_windows_command # Shared with the UI form handlers
 
 __all__ = [
     "load_mcpo_settings",
     "save_mcpo_settings",
     "create_server_definition",
+    "create_server_definitions_bulk",
+    "get_existing_server_names",
     "get_server_definition",
     "get_server_definitions",
+    "count_server_definitions",
     "update_server_definition",
     "delete_server_definition",
     "toggle_server_enabled",
     "generate_mcpo_config_file",
     "generate_mcpo_config_content_for_windows",
     "analyze_bulk_server_definitions",
+    "normalize_server_fields",
+    "deadapt_windows_command",
 ]
\ No newline at end of file
@@ -1,7 +1,7 @@
 # mcpo_control_panel/services/config_managers/definition_manager.py
 import logging
-from typing import List, Optional
-from sqlmodel import Session, select
+from typing import Iterable, List, Optional, Set
+from sqlmodel import Session, select, func
 
 from ...models.server_definition import (
     ServerDefinition, ServerDefinitionCreate, ServerDefinitionUpdate
@@ -21,6 +21,31 @@ def create_server_definition(db: Session, *, definition_in: ServerDefinitionCrea
     logger.info(f"Server definition '{db_definition.name}' created with ID: {db_definition.id}")
     return db_definition
 
+def get_existing_server_names(db: Session, names: Iterable[str]) -> Set[str]:
+    """Returns the subset of `names` that already exist, using a single IN query."""
+    names = list(names)
+    if not names: return set()
+    return set(db.exec(select(ServerDefinition.name).where(ServerDefinition.name.in_(names))).all())
+
+def create_server_definitions_bulk(db: Session, definitions_in: List[ServerDefinitionCreate]) -> List[ServerDefinition]:
+    """
+    Inserts several definitions in one transaction. Raises ValueError (and inserts nothing)
+    if any name is duplicated in the batch or already exists.
+    """
+    logger.info(f"Creating {len(definitions_in)} server definitions in bulk")
+    if not definitions_in: return []
+    names = [d.name for d in definitions_in]
+    if len(set(names)) != len(names):
+        raise ValueError("Duplicate server names in bulk request.")
+    existing = get_existing_server_names(db, names)
+    if existing:
+        raise ValueError(f"Server definitions already exist: {', '.join(sorted(existing))}.")
+    db_definitions = [ServerDefinition.model_validate(d) for d in definitions_in]
+    db.add_all(db_definitions)
+    db.commit()
+    logger.info(f"Bulk created {len(db_definitions)} server definitions.")
+    return db_definitions
+
 def get_server_definition(db: Session, server_id: int) -> Optional[ServerDefinition]:
     logger.debug(f"Getting server definition with ID: {server_id}")
     statement = select(ServerDefinition).where(ServerDefinition.id == server_id)
@@ -45,6 +70,13 @@ def get_server_definitions(
     definitions = db.exec(statement).all()
     return definitions
 
+def count_server_definitions(db: Session, only_enabled: bool = False) -> int:
+    """Counts definitions in the database without loading any rows."""
+    statement = select(func.count()).select_from(ServerDefinition)
+    if only_enabled:
+        statement = statement.where(ServerDefinition.is_enabled == True)
+    return db.exec(statement).one()
+
 def update_server_definition(db: Session, *, server_id: int, definition_in: ServerDefinitionUpdate) -> Optional[ServerDefinition]:
     logger.info(f"Updating server definition with ID: {server_id}")
     db_definition = get_server_definition(db, server_id)
@@ -1,7 +1,9 @@
 # mcpo_control_panel/services/config_managers/file_generator.py
+import hashlib
 import json
 import logging
 import os
+import orjson
 from typing import List, Optional, Dict, Any, TypedDict, Tuple
 from pathlib import Path
 from sqlmodel import Session
@@ -9,8 +11,10 @@ from pydantic import ValidationError
 
 from ...models.server_definition import ServerDefinitionCreate, ServerDefinition # Import ServerDefinition for _build_mcp_servers_config_dict
 from ...models.mcpo_settings import McpoSettings
-from .definition_manager import get_server_definitions # Import from sibling module
-from sqlmodel import select
+from .definition_manager import ( # Import from sibling module
+    get_server_definitions, get_existing_server_names
+)
+from .server_fields import URL_SERVER_TYPES, deadapt_windows_command, normalize_server_fields
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +28,9 @@ class AnalysisResult(TypedDict):
     existing: List[str]
     invalid: List[InvalidServerInfo]
 
+# Digest and mtime of the last config this process wrote, keyed by output path
+_written_config_digests: Dict[str, Tuple[str, int]] = {}
+
 def _get_data_dir() -> Path: # Helper specific to this module if needed for default paths
     return Path(os.getenv("MCPO_MANAGER_DATA_DIR_EFFECTIVE", Path.home() / ".mcpo_manager_data"))
 
@@ -132,9 +139,24 @@ def generate_mcpo_config_file(db: Session, settings: McpoSettings) -> bool:
     try:
         mcp_servers_config = _build_mcp_servers_config_dict(db, settings, adapt_for_windows=False)
         final_config = {"mcpServers": mcp_servers_config}
+        config_json_string = json.dumps(final_config, indent=2, ensure_ascii=False)
+        digest = hashlib.blake2b(config_json_string.encode('utf-8'), digest_size=16).hexdigest()
+        cache_key = str(output_path)
+
+        # Skip the write when the content is unchanged and the file was not touched since we wrote it
+        previous = _written_config_digests.get(cache_key)
+        if previous is not None and previous[0] == digest:
+            try:
+                if output_path.stat().st_mtime_ns == previous[1]:
+                    logger.info(f"MCPO configuration unchanged ({len(mcp_servers_config)} servers), skipped writing {output_path}.")
+                    return True
+            except OSError:
+                pass
+
         output_path.parent.mkdir(parents=True, exist_ok=True)
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(final_config, f, indent=2, ensure_ascii=False)
+            f.write(config_json_string)
+        _written_config_digests[cache_key] = (digest, output_path.stat().st_mtime_ns)
         logger.info(f"MCPO configuration file successfully generated with {len(mcp_servers_config)} servers to {output_path}.")
         return True
     except Exception as e:
@@ -156,26 +178,13 @@ def generate_mcpo_config_content_for_windows(db: Session, settings: McpoSettings
         logger.error(f"Error generating MCPO configuration content for Windows: {e}", exc_info=True)
         return f"// Error generating Windows config: {e}"
 
-def _deadapt_windows_command(command: Optional[str], args: List[str]) -> Tuple[Optional[str], List[str]]:
-    if command == "cmd" and args and args[0].lower() == "/c" and len(args) > 1:
-        executable = args[1].lower()
-        if executable == "npx":
-            args_start_index = 2
-            if len(args) > 2 and args[2] == "-y": args_start_index = 3
-            return "npx", args[args_start_index:]
-        elif executable == "uvx":
-            return "uvx", args[2:]
-        elif executable == "docker":
-            return "docker", args[3:] if len(args) > 2 and args[2].lower() == "run" else args[2:]
-    return command, args
-
 def _extract_servers_from_json(config_json_str: str) -> Tuple[List[Tuple[str, Dict[str, Any]]], List[str]]:
     servers_to_process: List[Tuple[str, Dict[str, Any]]] = []
     errors: List[str] = []
     processed_input_names: set[str] = set()
     try:
-        data = json.loads(config_json_str)
-    except json.JSONDecodeError as e:
+        data = orjson.loads(config_json_str)
+    except orjson.JSONDecodeError as e:
         errors.append(f"Invalid JSON format: {str(e)}"); return [], errors
 
     if isinstance(data, list):
@@ -215,6 +224,48 @@ def _extract_servers_from_json(config_json_str: str) -> Tuple[List[Tuple[str, Di
     if not servers_to_process and not errors: errors.append("No server entries extracted.")
     return servers_to_process, errors
 
+def _normalize_bulk_entry(
+    server_name: str, config_data_item: Dict[str, Any], default_enabled: bool
+) -> Tuple[Optional[ServerDefinitionCreate], Optional[str]]:
+    """Turns one 'mcpServers' entry into a definition. Returns (definition, None) or (None, error reason)."""
+    try:
+        original_command = config_data_item.get("command")
+        original_args = config_data_item.get("args", [])
+        final_env = config_data_item.get("env", {})
+        original_url = config_data_item.get("url")
+        original_type = config_data_item.get("type")
+
+        if not isinstance(original_args, list): original_args = []
+        if not isinstance(final_env, dict): final_env = {}
+
+        final_command, final_args = deadapt_windows_command(original_command, original_args)
+
+        if final_command: final_server_type = "stdio"
+        elif original_url: final_server_type = original_type if original_type in URL_SERVER_TYPES else URL_SERVER_TYPES[0]
+        else: raise ValueError("Cannot determine type: 'command' or 'url' must be provided.")
+        # Same per-type field rules as the single-server forms
+        final_command, final_url, final_args, final_env, _ = normalize_server_fields(
+            final_server_type, final_command, original_url, final_args, final_env
+        )
+
+        # Every field is now decided above, so only the string types remain to be checked;
+        # that lets us skip full Pydantic validation for each row
+        if final_command is not None and not isinstance(final_command, str): raise ValueError("'command' must be a string.")
+        if final_url is not None and not isinstance(final_url, str): raise ValueError("'url' must be a string.")
+        if not all(isinstance(arg, str) for arg in final_args): raise ValueError("All 'args' entries must be strings.")
+        if not all(isinstance(k, str) and isinstance(v, str) for k, v in final_env.items()):
+            raise ValueError("All 'env' keys and values must be strings.")
+
+        definition_to_validate = ServerDefinitionCreate.model_construct(
+            name=server_name, is_enabled=default_enabled, server_type=final_server_type,
+            command=final_command, args=final_args, env_vars=final_env, url=final_url
+        )
+        return definition_to_validate, None
+    except (ValueError, ValidationError) as e: return None, f"{e.__class__.__name__}: {str(e)}"
+    except Exception as e:
+        logger.error(f"Validating '{server_name}': {e}", exc_info=True)
+        return None, f"Unexpected error: {e}"
+
 def analyze_bulk_server_definitions(
     db: Session, config_json_str: str, default_enabled: bool = False
 ) -> Tuple[AnalysisResult, List[str]]:
@@ -222,38 +273,12 @@ def analyze_bulk_server_definitions(
     servers_to_process, parsing_errors = _extract_servers_from_json(config_json_str)
     if not servers_to_process and parsing_errors: return analysis, parsing_errors
 
-    existing_db_names = set(db.exec(select(ServerDefinition.name)).all())
+    # Only look up the names being imported instead of loading every name in the table
+    existing_db_names = get_existing_server_names(db, [server_name for server_name, _ in servers_to_process])
     for server_name, config_data_item in servers_to_process:
         if server_name in existing_db_names:
             analysis["existing"].append(server_name); continue
-        error_reason = None
-        try:
-            original_command = config_data_item.get("command")
-            original_args = config_data_item.get("args", [])
-            final_env = config_data_item.get("env", {})
-            original_url = config_data_item.get("url")
-            original_type = config_data_item.get("type")
-
-            if not isinstance(original_args, list): original_args = []
-            if not isinstance(final_env, dict): final_env = {}
-
-            final_command, final_args = _deadapt_windows_command(original_command, original_args)
-            final_url = original_url
-            final_server_type = None
-
-            if final_command:
-                final_server_type = "stdio"; final_url = None
-            elif final_url:
-                final_server_type = original_type if original_type in ["sse", "streamable_http"] else "sse"
-                final_command = None; final_args = []; final_env = {}
-            else: raise ValueError("Cannot determine type: 'command' or 'url' must be provided.")
-
-            definition_to_validate = ServerDefinitionCreate(
-                name=server_name, is_enabled=default_enabled, server_type=final_server_type,
-                command=final_command, args=final_args, env_vars=final_env, url=final_url
-            )
-            analysis["valid_new"].append(definition_to_validate)
-        except (ValueError, ValidationError) as e: error_reason = f"{e.__class__.__name__}: {str(e)}"
-        except Exception as e: error_reason = f"Unexpected error: {e}"; logger.error(f"Validating '{server_name}': {e}", exc_info=True)
-        if error_reason: analysis["invalid"].append({"name": server_name, "data": config_data_item, "error": error_reason})
+        definition, error_reason = _normalize_bulk_entry(server_name, config_data_item, default_enabled)
+        if definition is not None: analysis["valid_new"].append(definition)
+        else: analysis["invalid"].append({"name": server_name, "data": config_data_item, "error": error_reason})
     return analysis, parsing_errors
\ No newline at end of file
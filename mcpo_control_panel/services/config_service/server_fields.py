@@ -0,0 +1,54 @@
+# mcpo_control_panel/services/config_service/server_fields.py
+"""Server field helpers shared by the definition services and the UI form handlers."""
+from typing import Dict, List, Optional, Tuple
+
+# Per server type: (keeps command/args/env, keeps url, name of the required field)
+SERVER_TYPE_FIELD_RULES: Dict[str, Tuple[bool, bool, str]] = {
+    "stdio": (True, False, "Command"),
+    "sse": (False, True, "URL"),
+    "streamable_http": (False, True, "URL"),
+}
+# Types that connect by URL, in table order; the first one is the default when a bulk entry only has a url
+URL_SERVER_TYPES: Tuple[str, ...] = tuple(
+    server_type for server_type, (_, keeps_url, _) in SERVER_TYPE_FIELD_RULES.items() if keeps_url
+)
+
+# Executables that the Windows config wraps as `cmd /c <exe> ...`, mapped to
+# (optional token inserted after the executable, whether that token matches case-insensitively)
+_WINDOWS_WRAPPED_COMMANDS: Dict[str, Tuple[Optional[str], bool]] = {
+    "npx": ("-y", False),
+    "uvx": (None, False),
+    "docker": ("run", True),
+}
+
+def normalize_server_fields(
+    server_type: str, command: Optional[str], url: Optional[str], args: List[str], env_vars: Dict[str, str]
+) -> Tuple[Optional[str], Optional[str], List[str], Dict[str, str], Optional[str]]:
+    """Clears the fields that don't apply to `server_type` and checks the required one. Returns (command, url, args, env_vars, error)."""
+    rule = SERVER_TYPE_FIELD_RULES.get(server_type)
+    if rule is None:
+        return command, url, args, env_vars, "Unknown server type."
+    keeps_command, keeps_url, required_field = rule
+    if not keeps_command:
+        command, args, env_vars = None, [], {}
+    if not keeps_url:
+        url = None
+    error = None
+    if not (command if keeps_command else url):
+        error = f"The '{required_field}' field is mandatory for type '{server_type}'."
+    return command, url, args, env_vars, error
+
+def deadapt_windows_command(command: Optional[str], args: List[str]) -> Tuple[Optional[str], List[str]]:
+    """Reverses the `cmd /c <exe> ...` wrapping of the Windows config. Returns (command, args)."""
+    if command != "cmd" or len(args) < 2 or args[0].lower() != "/c":
+        return command, args
+    executable = args[1].lower()
+    spec = _WINDOWS_WRAPPED_COMMANDS.get(executable)
+    if spec is None:
+        return command, args
+    optional_token, ignore_case = spec
+    args_start_index = 2
+    if optional_token and len(args) > 2:
+        token = args[2].lower() if ignore_case else args[2]
+        if token == optional_token: args_start_index = 3
+    return executable, args[args_start_index:]
@@ -3,6 +3,7 @@ import json
 import logging
 import os
 from pathlib import Path
+from typing import Optional, Tuple
 from pydantic import ValidationError
 
 from ...models.mcpo_settings import McpoSettings
@@ -10,15 +11,48 @@ from ...models.mcpo_settings import McpoSettings
 logger = logging.getLogger(__name__)
 SETTINGS_FILE_NAME = "mcpo_manager_settings.json"
 
+# Parsed settings are reused until the file's mtime/size changes, so hot paths
+# (health check loop, every UI request) cost a single stat() instead of a JSON parse.
+_settings_cache: Optional[McpoSettings] = None
+_settings_cache_key: Optional[Tuple[str, int, int]] = None
+
 def _get_data_dir() -> Path:
     return Path(os.getenv("MCPO_MANAGER_DATA_DIR_EFFECTIVE", Path.home() / ".mcpo_manager_data"))
 
 def _get_settings_file_path() -> Path:
     return _get_data_dir() / SETTINGS_FILE_NAME
 
+def _invalidate_settings_cache():
+    global _settings_cache, _settings_cache_key
+    _settings_cache = None
+    _settings_cache_key = None
+
+def _settings_from_data(settings_data: dict) -> McpoSettings:
+    """Builds McpoSettings from the on-disk JSON form, normalising config_file_path."""
+    # Ensure config_file_path is correctly initialized relative to data_dir logic
+    if "config_file_path" not in settings_data or not settings_data.get("config_file_path"):
+        logger.info(f"Missing 'config_file_path' in settings, re-initializing to default name within data_dir: {_get_data_dir()}")
+        settings_data["config_file_path"] = "mcp_generated_config.json"
+    elif not Path(settings_data["config_file_path"]).is_absolute():
+        original_path = settings_data["config_file_path"]
+        filename_only = Path(original_path).name
+        if original_path != filename_only:
+            logger.info(f"Relative 'config_file_path' ('{original_path}') found in settings, storing only filename: '{filename_only}' for consistency.")
+        settings_data["config_file_path"] = filename_only
+    return McpoSettings(**settings_data)
+
 def load_mcpo_settings() -> McpoSettings:
+    global _settings_cache, _settings_cache_key
     settings_file_path = _get_settings_file_path()
-    if not settings_file_path.exists():
+    try:
+        stat_result = settings_file_path.stat()
+    except FileNotFoundError:
+        stat_result = None
+    if stat_result is not None:
+        cache_key = (str(settings_file_path), stat_result.st_mtime_ns, stat_result.st_size)
+        if _settings_cache is not None and _settings_cache_key == cache_key:
+            return _settings_cache
+    if stat_result is None:
         logger.warning(f"Settings file {settings_file_path} not found. Using default settings.")
         default_settings = McpoSettings(config_file_path=str(_get_data_dir() / "mcp_generated_config.json"))
         save_mcpo_settings(default_settings) # Save defaults if file not found
@@ -26,20 +60,10 @@ def load_mcpo_settings() -> McpoSettings:
     try:
         with open(settings_file_path, 'r') as f:
             settings_data = json.load(f)
-            # Ensure config_file_path is correctly initialized relative to data_dir logic
-            if "config_file_path" not in settings_data or not settings_data.get("config_file_path"):
-                logger.info(f"Missing 'config_file_path' in settings, re-initializing to default name within data_dir: {_get_data_dir()}")
-                settings_data["config_file_path"] = "mcp_generated_config.json"
-            elif not Path(settings_data["config_file_path"]).is_absolute():
-                original_path = settings_data["config_file_path"]
-                filename_only = Path(original_path).name
-                if original_path != filename_only:
-                    logger.info(f"Relative 'config_file_path' ('{original_path}') found in settings, storing only filename: '{filename_only}' for consistency.")
-                settings_data["config_file_path"] = filename_only
-            
-            settings = McpoSettings(**settings_data)
-            logger.info(f"MCPO settings loaded from {settings_file_path}")
-            return settings
+        settings = _settings_from_data(settings_data)
+        logger.info(f"MCPO settings loaded from {settings_file_path}")
+        _settings_cache, _settings_cache_key = settings, cache_key
+        return settings
     except (IOError, json.JSONDecodeError, TypeError, ValidationError) as e:
         logger.error(f"Error loading or parsing settings file {settings_file_path}: {e}. Using default settings.", exc_info=True)
         default_settings = McpoSettings(config_file_path="mcp_generated_config.json") # Default filename
@@ -47,13 +71,25 @@ def load_mcpo_settings() -> McpoSettings:
         return default_settings
 
 def save_mcpo_settings(settings: McpoSettings) -> bool:
+    global _settings_cache, _settings_cache_key
     settings_file_path = _get_settings_file_path()
     logger.info(f"Saving MCPO settings to {settings_file_path}")
+    _invalidate_settings_cache()
     try:
         settings_file_path.parent.mkdir(parents=True, exist_ok=True)
+        settings_data = settings.model_dump(mode='json', exclude_none=True)
         with open(settings_file_path, 'w') as f:
-            json.dump(settings.model_dump(mode='json', exclude_none=True), f, indent=2)
+            json.dump(settings_data, f, indent=2)
         logger.info(f"MCPO settings successfully saved to {settings_file_path}")
+        # Prime the cache with exactly what the next load would produce, so it skips the re-read
+        try:
+            stat_result = settings_file_path.stat()
+            primed = _settings_from_data(settings_data)
+        except (OSError, ValidationError) as e:
+            logger.debug(f"Settings cache not primed after save: {e}")
+        else:
+            _settings_cache = primed
+            _settings_cache_key = (str(settings_file_path), stat_result.st_mtime_ns, stat_result.st_size)
         return True
     except IOError as e:
         logger.error(f"Error writing MCPO settings file to {settings_file_path}: {e}")
@@ -3,20 +3,27 @@
 # (Refactored: No PID files, direct process object management)
 # ================================================
 import asyncio
+import json
 import logging
 import os
+import random
 import signal
 import sys
 import subprocess # Keep for DEVNULL etc.
+import threading
+import time
+from collections import OrderedDict, deque
 from typing import Optional, Tuple, List, Dict, Any, Callable
 import httpx
+from sqlalchemy.orm import sessionmaker
 from sqlmodel import Session as SQLModelSession
 import contextlib
+import contextvars
 from pathlib import Path
 
 from ..models.mcpo_settings import McpoSettings
 from .config_service import load_mcpo_settings, generate_mcpo_config_file, get_server_definitions
-from ..db.database import engine # Import engine directly for background tasks
+from ..db.database import engine, batch_engine # Import engines directly for background tasks
 
 logger = logging.getLogger(__name__)
 
@@ -25,20 +32,113 @@ logger = logging.getLogger(__name__)
 _mcpo_process: Optional[asyncio.subprocess.Process] = None
 _mcpo_log_file_handle: Optional[Any] = None # To hold the open log file handle
 
+# --- Shared HTTP Client ---
+# All internal requests go to the same origin (http://127.0.0.1:<port>), so one
+# pooled client keeps connections alive between calls instead of opening a new
+# socket per request.
+_http_client: Optional[httpx.AsyncClient] = None
+_HTTP_CLIENT_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60.0)
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Returns the shared AsyncClient, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(limits=_HTTP_CLIENT_LIMITS, follow_redirects=True)
+    return _http_client
+
+def open_http_client():
+    """Creates the shared AsyncClient up front. Called on application startup, before the health check starts."""
+    _get_http_client()
+    logger.info("Shared HTTP client initialised.")
+
+async def close_http_client():
+    """Closes the shared AsyncClient. Called on application shutdown."""
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+        logger.info("Shared HTTP client closed.")
+    _http_client = None
+
 # --- Health Check State ---
 _health_check_failure_counter = 0
-_mcpo_manual_operation_in_progress = False # Flag for manual start/stop/restart
+# Failed checks since the last successful one; unlike the counter above it survives restarts and drives the backoff
+_health_check_failure_streak = 0
+_health_check_outage_started_at: Optional[float] = None # time.monotonic() of the first failure in the streak
+# How long past outages took to recover (seconds); used to place retries where recoveries usually happen
+_health_check_recovery_durations: deque = deque(maxlen=200)
+_MIN_RECOVERY_SAMPLES = 20
+# Serialises start/stop/restart; the health check skips its tick while it is held
+_mcpo_lock = asyncio.Lock()
+# Set to cut the health check loop's current wait short (start/stop, settings change)
+_hc_wakeup = asyncio.Event()
+# Circuit breaker: with auto-restart disabled, the loop parks on this after max failures until resumed
+_hc_resume_event = asyncio.Event()
+
+def wake_health_check():
+    """Wakes the health check loop so it re-reads settings and MCPO state immediately."""
+    _hc_wakeup.set()
+    _hc_resume_event.set()
+
+def resume_health_check():
+    """Releases the health check loop if it is parked waiting for manual intervention."""
+    _hc_resume_event.set()
+
+# Spread periodic waits by a few percent so the loop does not stay phase-aligned with other timers
+_HC_WAIT_JITTER = 0.03
+
+async def _wait_for_next_health_check(timeout: float):
+    """Waits about `timeout` seconds (with small jitter), returning early if wake_health_check() is called."""
+    timeout *= random.uniform(1 - _HC_WAIT_JITTER, 1 + _HC_WAIT_JITTER)
+    try:
+        await asyncio.wait_for(_hc_wakeup.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        _hc_wakeup.clear()
+
+# --- Path Existence Cache ---
+# Short-lived memo for os.path.exists on paths that are checked on every call
+# (config file, log file and its directory). Bounded to a small LRU.
+_PATH_EXISTS_TTL_SECONDS = 2.0
+_PATH_EXISTS_CACHE_MAX_ENTRIES = 128
+_path_exists_cache: "OrderedDict[str, Tuple[float, bool]]" = OrderedDict()
+
+def path_exists_cached(path: str, ttl: float = _PATH_EXISTS_TTL_SECONDS) -> bool:
+    """os.path.exists with a TTL cache. Use invalidate_path_exists_cache after creating/removing the path."""
+    now = time.monotonic()
+    entry = _path_exists_cache.get(path)
+    if entry is not None and now - entry[0] < ttl:
+        _path_exists_cache.move_to_end(path)
+        return entry[1]
+    exists = os.path.exists(path)
+    _path_exists_cache[path] = (now, exists)
+    _path_exists_cache.move_to_end(path)
+    if len(_path_exists_cache) > _PATH_EXISTS_CACHE_MAX_ENTRIES:
+        _path_exists_cache.popitem(last=False)
+    return exists
+
+def invalidate_path_exists_cache(path: Optional[str] = None):
+    """Drops the cached existence result for a path (or the whole cache if path is None)."""
+    if path is None:
+        _path_exists_cache.clear()
+    else:
+        _path_exists_cache.pop(path, None)
 
 # --- Helper to get data directory ---
+_ensured_data_dir: Optional[Path] = None # Last directory created/verified by _get_data_dir_path
+
 def _get_data_dir_path() -> Path:
     """Determines the path to the manager's data directory."""
+    global _ensured_data_dir
     effective_data_dir_str = os.getenv("MCPO_MANAGER_DATA_DIR_EFFECTIVE")
     if effective_data_dir_str:
         data_dir = Path(effective_data_dir_str)
     else:
         # Fallback only if env var not set (should be set by __main__.py)
         data_dir = Path.home() / ".mcpo_manager_data"
-    data_dir.mkdir(parents=True, exist_ok=True)
+    if data_dir != _ensured_data_dir:
+        os.makedirs(data_dir, exist_ok=True)
+        _ensured_data_dir = data_dir
     return data_dir
 
 # --- Close Log File Handle ---
@@ -58,13 +158,13 @@ def _close_log_file_handle():
 
 async def start_mcpo(settings: McpoSettings) -> Tuple[bool, str]:
     """Asynchronously starts the MCPO process if it's not already running."""
-    global _mcpo_process, _mcpo_log_file_handle, _mcpo_manual_operation_in_progress, _health_check_failure_counter
+    async with _mcpo_lock:
+        return await _start_mcpo_unlocked(settings)
 
-    # if _mcpo_manual_operation_in_progress:
-    #     logger.warning("Attempted to start MCPO during another management operation. Aborted.")
-    #     return False, "MCPO management operation already in progress."
+async def _start_mcpo_unlocked(settings: McpoSettings) -> Tuple[bool, str]:
+    """start_mcpo body; the caller must hold _mcpo_lock."""
+    global _mcpo_process, _mcpo_log_file_handle, _health_check_failure_counter, _ensured_data_dir
 
-    _mcpo_manual_operation_in_progress = True
     try:
         # Check if process object exists and process hasn't exited
         if _mcpo_process and _mcpo_process.returncode is None:
@@ -74,8 +174,9 @@ async def start_mcpo(settings: McpoSettings) -> Tuple[bool, str]:
 
         # Check config file existence before starting
         config_path = Path(settings.config_file_path)
-        if not config_path.is_file():
+        if not path_exists_cached(settings.config_file_path):
             config_path.parent.mkdir(parents=True, exist_ok=True)
+            invalidate_path_exists_cache(settings.config_file_path)
             if not config_path.is_file():
                  msg = f"MCPO configuration file not found: {settings.config_file_path}. Cannot start."
                  logger.error(msg)
@@ -90,18 +191,28 @@ async def start_mcpo(settings: McpoSettings) -> Tuple[bool, str]:
         process_cwd = str(_get_data_dir_path())
         stdout_redir = asyncio.subprocess.DEVNULL
         stderr_redir = asyncio.subprocess.DEVNULL
+        log_fd: Optional[int] = None # Raw descriptor handed to the child (non-Windows)
 
         # Prepare log file redirection
         _close_log_file_handle() # Ensure previous handle is closed
         if settings.log_file_path:
             try:
                 log_dir = os.path.dirname(settings.log_file_path)
-                if log_dir:
+                if log_dir and not path_exists_cached(log_dir):
                     Path(log_dir).mkdir(parents=True, exist_ok=True)
-                # Use 'a' mode, line buffering
-                _mcpo_log_file_handle = open(settings.log_file_path, 'a', buffering=1, encoding='utf-8', errors='ignore')
-                stdout_redir = _mcpo_log_file_handle
-                stderr_redir = _mcpo_log_file_handle
+                    invalidate_path_exists_cache(log_dir)
+                if sys.platform != "win32":
+                    # The child writes straight to the inherited descriptor; no Python-level
+                    # buffering/encoding layer is needed in the parent.
+                    log_fd = os.open(settings.log_file_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+                    stdout_redir = log_fd
+                    stderr_redir = log_fd
+                else:
+                    # Handle inheritance differs on Windows, keep a file object open for the child
+                    _mcpo_log_file_handle = open(settings.log_file_path, 'a', buffering=1, encoding='utf-8', errors='ignore')
+                    stdout_redir = _mcpo_log_file_handle
+                    stderr_redir = _mcpo_log_file_handle
+                invalidate_path_exists_cache(settings.log_file_path) # The file may have just been created
                 logger.info(f"MCPO stdout/stderr will be redirected to {settings.log_file_path}")
             except Exception as e:
                 logger.error(f"Failed to open log file '{settings.log_file_path}': {e}. Output will be redirected to DEVNULL.", exc_info=True)
@@ -112,21 +223,25 @@ async def start_mcpo(settings: McpoSettings) -> Tuple[bool, str]:
         # Start the process using asyncio
         try:
             logger.info(f"Executing asyncio.create_subprocess_exec: {command}")
-            _mcpo_process = await asyncio.create_subprocess_exec(
-                *command,
-                stdout=stdout_redir,
-                stderr=stderr_redir,
-                stdin=asyncio.subprocess.DEVNULL,
-                cwd=process_cwd,
-                # On Linux/macOS, start_new_session=True makes it a group leader,
-                # which helps if we ever need os.killpg (though stop_mcpo now uses process object)
-                start_new_session=(sys.platform != "win32"),
-                 # On Windows, CREATE_NEW_PROCESS_GROUP is often needed for reliable termination
-                 # if the process spawns children outside the main process tree that Python tracks easily.
-                 # However, process.terminate/kill should work on the main process object.
-                 # Let's rely on process.terminate/kill first.
-                 # creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if sys.platform == "win32" else 0
-            )
+            try:
+                _mcpo_process = await asyncio.create_subprocess_exec(
+                    *command,
+                    stdout=stdout_redir,
+                    stderr=stderr_redir,
+                    stdin=asyncio.subprocess.DEVNULL,
+                    cwd=process_cwd,
+                    # On Linux/macOS, start_new_session=True makes it a group leader,
+                    # which helps if we ever need os.killpg (though stop_mcpo now uses process object)
+                    start_new_session=(sys.platform != "win32"),
+                     # On Windows, CREATE_NEW_PROCESS_GROUP is often needed for reliable termination
+                     # if the process spawns children outside the main process tree that Python tracks easily.
+                     # However, process.terminate/kill should work on the main process object.
+                     # Let's rely on process.terminate/kill first.
+                     # creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if sys.platform == "win32" else 0
+                )
+            finally:
+                if log_fd is not None:
+                    os.close(log_fd) # The child has its own copy of the descriptor
             await asyncio.sleep(0.5) # Short delay to check if it immediately fails
 
             if _mcpo_process.returncode is not None:
@@ -145,6 +260,7 @@ async def start_mcpo(settings: McpoSettings) -> Tuple[bool, str]:
         except FileNotFoundError:
             msg = "Error starting mcpo: 'mcpo' command not found. Ensure mcpo is installed and in PATH."
             logger.error(msg)
+            _ensured_data_dir = None # The CWD may have been removed; re-create it on the next attempt
             _mcpo_process = None
             _close_log_file_handle()
             return None, msg
@@ -162,18 +278,17 @@ async def start_mcpo(settings: McpoSettings) -> Tuple[bool, str]:
             return False, msg
 
     finally:
-        await asyncio.sleep(0.1)
-        _mcpo_manual_operation_in_progress = False
+        wake_health_check()
 
 async def stop_mcpo() -> Tuple[bool, str]:
     """Asynchronously stops the MCPO process using the stored process object."""
-    global _mcpo_process, _mcpo_manual_operation_in_progress
+    async with _mcpo_lock:
+        return await _stop_mcpo_unlocked()
 
-    # if _mcpo_manual_operation_in_progress:
-    #     logger.warning("Attempted to stop MCPO during another management operation. Aborted.")
-    #     return False, "MCPO management operation already in progress."
+async def _stop_mcpo_unlocked() -> Tuple[bool, str]:
+    """stop_mcpo body; the caller must hold _mcpo_lock."""
+    global _mcpo_process
 
-    _mcpo_manual_operation_in_progress = True
     process_to_stop = _mcpo_process # Local reference
 
     try:
@@ -245,80 +360,69 @@ async def stop_mcpo() -> Tuple[bool, str]:
          _close_log_file_handle()
          return False, f"Internal error in stop_mcpo function: {e_main}"
     finally:
-        await asyncio.sleep(0.1)
-        _mcpo_manual_operation_in_progress = False
+        wake_health_check()
 
-async def restart_mcpo_process_with_new_config(db_session: SQLModelSession, settings: McpoSettings) -> Tuple[bool, str]:
+async def restart_mcpo_process_with_new_config(db_session: Optional[SQLModelSession], settings: McpoSettings) -> Tuple[bool, str]:
     """
     Stops mcpo, generates config (if not in manual mode), then starts mcpo.
+    The whole sequence runs under a single acquisition of _mcpo_lock.
+    With db_session=None the config is generated through the batched DB worker.
     """
-    global _mcpo_manual_operation_in_progress
+    async with _mcpo_lock:
+        return await _restart_mcpo_unlocked(db_session, settings)
 
-    _mcpo_manual_operation_in_progress = True # Assuming this flag is managed correctly elsewhere for broader ops
+async def _restart_mcpo_unlocked(db_session: Optional[SQLModelSession], settings: McpoSettings) -> Tuple[bool, str]:
     logger.info("Starting MCPO restart process...")
     final_messages = []
     restart_success = False
-    config_generated_or_skipped = False
 
     try:
         # 1. Stop the current process (if running)
-        stop_success, stop_msg = await stop_mcpo()
+        stop_success, stop_msg = await _stop_mcpo_unlocked()
         final_messages.append(f"Stop: {stop_msg}")
 
         if not stop_success and "not running" not in stop_msg.lower():
             message = " | ".join(final_messages) + " CRITICAL ERROR: Failed to stop current MCPO process. Restart cancelled."
             logger.error(message)
-            # _mcpo_manual_operation_in_progress might be released by stop_mcpo's finally
             return False, message
 
         # 2. Generate new configuration file IF NOT IN MANUAL MODE
         if not settings.manual_config_mode_enabled:
             logger.info("Restart: Automated mode. Generating new MCPO configuration file...")
-            if generate_mcpo_config_file(db_session, settings): # generate_mcpo_config_file is from config_service (facade)
+            if db_session is not None:
+                # Sync ORM query + file write; run it in a thread so the event loop keeps serving requests
+                config_generated = await asyncio.to_thread(generate_mcpo_config_file, db_session, settings) # generate_mcpo_config_file is from config_service (facade)
+            else:
+                config_generated = await submit_db_op(lambda session: generate_mcpo_config_file(session, settings))
+            invalidate_path_exists_cache(settings.config_file_path)
+            if config_generated:
                 final_messages.append("Configuration file successfully generated from database.")
-                config_generated_or_skipped = True
             else:
                 message = " | ".join(final_messages) + " ERROR: Failed to generate configuration file. MCPO start cancelled."
                 logger.error(message)
-                _mcpo_manual_operation_in_progress = False # Release flag as we abort
                 return False, message
         else:
             logger.info("Restart: Manual config mode enabled. Skipping automatic configuration file generation.")
             final_messages.append("Manual mode: Configuration file generation skipped.")
             # We assume the manual config is already present and correct.
             # generate_mcpo_config_file in lifespan would have created a default empty one if it was missing.
-            config_generated_or_skipped = True 
             # Optionally, verify existence of settings.config_file_path here
-            if not os.path.exists(settings.config_file_path):
+            if not path_exists_cached(settings.config_file_path):
                 warn_msg = f"Warning: Manual config mode is on, but config file '{settings.config_file_path}' not found during restart. MCPO might fail to start."
                 logger.warning(warn_msg)
                 final_messages.append(warn_msg)
                 # Proceeding anyway, mcpo start will fail if config is truly missing
 
         # 3. Start MCPO with the new/existing configuration
-        if config_generated_or_skipped: # Proceed only if config step was okay or skipped intentionally
-            logger.info("Restart: Attempting to start MCPO...")
-            start_success, start_msg = await start_mcpo(settings)
-            final_messages.append(f"Start: {start_msg}")
-            restart_success = start_success
-        else:
-            # This case should ideally not be hit due to earlier returns, but as a safeguard:
-            logger.error("Restart: Configuration step failed or was not properly skipped. MCPO start cancelled.")
-            restart_success = False
-            # Ensure flag is released if we somehow reach here
-            if _mcpo_manual_operation_in_progress:
-                await asyncio.sleep(0.1) # ensure flag from stop_mcpo is not interfered
-                _mcpo_manual_operation_in_progress = False
-
+        logger.info("Restart: Attempting to start MCPO...")
+        start_success, start_msg = await _start_mcpo_unlocked(settings)
+        final_messages.append(f"Start: {start_msg}")
+        restart_success = start_success
 
     except Exception as e:
         logger.error(f"Unexpected error during MCPO restart process: {e}", exc_info=True)
         final_messages.append(f"Critical restart error: {e}")
         restart_success = False
-        # Ensure flag is released if error happened outside start/stop's finally
-        if _mcpo_manual_operation_in_progress:
-             await asyncio.sleep(0.1)
-             _mcpo_manual_operation_in_progress = False
 
     return restart_success, " | ".join(final_messages)
 
@@ -340,60 +444,166 @@ def get_mcpo_status() -> str:
         _close_log_file_handle()
         return "STOPPED"
 
+# --- Log Tail Reader State ---
+# The log file is opened once and the descriptor reused between calls,
+# so polling the logs page does not re-open the file on every request.
+_log_reader_fd: Optional[int] = None
+_log_reader_path: Optional[str] = None
+_log_reader_lock = threading.Lock() # Reads run in worker threads and share the descriptor
+_LOG_TAIL_CHUNK_SIZE = 64 * 1024
+_LOG_INCREMENT_MAX_BYTES = 256 * 1024 # Larger gaps fall back to a fresh tail instead of one huge append
+
+def _close_log_reader_fd():
+    """Closes the cached read-only descriptor of the log file, if any."""
+    global _log_reader_fd, _log_reader_path
+    if _log_reader_fd is not None:
+        try:
+            os.close(_log_reader_fd)
+        except OSError as e:
+            logger.warning(f"Failed to close cached log reader descriptor: {e}")
+    _log_reader_fd = None
+    _log_reader_path = None
+
+def _get_log_reader_fd(log_path: str) -> int:
+    """Returns a cached descriptor for log_path, reopening it if the path changed or the file was removed."""
+    global _log_reader_fd, _log_reader_path
+    if _log_reader_fd is not None:
+        if _log_reader_path == log_path and os.fstat(_log_reader_fd).st_nlink > 0:
+            return _log_reader_fd
+        _close_log_reader_fd()
+    _log_reader_fd = os.open(log_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    _log_reader_path = log_path
+    return _log_reader_fd
+
+def _pread(fd: int, size: int, offset: int) -> bytes:
+    """os.pread with a seek+read fallback for platforms that lack it (Windows)."""
+    if hasattr(os, "pread"):
+        return os.pread(fd, size, offset)
+    os.lseek(fd, offset, os.SEEK_SET)
+    return os.read(fd, size)
+
+def _read_tail_bytes(fd: int, size: int, lines: int) -> bytes:
+    """Reads backwards from `size` in chunks until more than `lines` newlines are collected."""
+    position = size
+    chunks: List[bytes] = []
+    newline_count = 0
+    # One extra newline is needed because the last line is usually newline-terminated
+    while position > 0 and newline_count <= lines:
+        read_size = min(_LOG_TAIL_CHUNK_SIZE, position)
+        position -= read_size
+        chunk = _pread(fd, read_size, position)
+        chunks.append(chunk)
+        newline_count += chunk.count(b"\n")
+    return b"".join(reversed(chunks))
+
+def _decode_log_lines(raw_lines: List[bytes]) -> List[str]:
+    return [line.decode('utf-8', errors='ignore').rstrip() for line in raw_lines]
+
+def _tail_log_file_sync(log_path: str, lines: int) -> List[str]:
+    """Returns the last `lines` lines of the log file."""
+    fd = _get_log_reader_fd(log_path)
+    data = _read_tail_bytes(fd, os.fstat(fd).st_size, lines)
+    return _decode_log_lines(data.splitlines()[-lines:] if lines > 0 else [])
+
+def _read_log_since_sync(log_path: str, offset: Optional[int], lines: int) -> Tuple[List[str], int, bool]:
+    """
+    Returns (lines, next_offset, reset). Only complete lines are returned, so next_offset always
+    sits just after a newline. reset=True means the lines are the last `lines` lines and replace
+    what the client shows: first load, empty view, truncated file or a backlog over the limit.
+    """
+    fd = _get_log_reader_fd(log_path)
+    size = os.fstat(fd).st_size
+    if not offset or offset > size or size - offset > _LOG_INCREMENT_MAX_BYTES:
+        data = _read_tail_bytes(fd, size, lines)
+        complete = data[:data.rfind(b"\n") + 1]
+        next_offset = size - (len(data) - len(complete))
+        return _decode_log_lines(complete.splitlines()[-lines:] if lines > 0 else []), next_offset, True
+    data = _pread(fd, size - offset, offset)
+    complete = data[:data.rfind(b"\n") + 1]
+    return _decode_log_lines(complete.splitlines()), offset + len(complete), False
+
 async def get_mcpo_logs(lines: int = 100, log_file_path: Optional[str] = None) -> List[str]:
     """Asynchronously reads the last N lines from the MCPO log file."""
-    # This function remains largely the same as it reads from a file path
     settings = load_mcpo_settings()
     actual_log_path = log_file_path or settings.log_file_path
 
     if not actual_log_path:
         logger.warning("Attempted to read MCPO logs, but log file path is not configured.")
         return ["Error: Log file path is not configured."]
-    if not os.path.exists(actual_log_path):
-        logger.warning(f"Attempted to read MCPO logs, but file not found: {actual_log_path}")
-        return [f"Error: Log file not found at path: {actual_log_path}"]
-
-    try:
-        from collections import deque
-        last_lines = deque(maxlen=lines)
 
-        def read_lines_sync():
+    # No separate existence check: opening (or re-validating) the cached descriptor
+    # raises FileNotFoundError when the file is missing.
+    def read_lines_sync():
+        with _log_reader_lock:
             try:
-                # Open in binary, decode ignoring errors
-                with open(actual_log_path, 'rb') as f:
-                    for line_bytes in f:
-                        last_lines.append(line_bytes.decode('utf-8', errors='ignore').rstrip())
-                return list(last_lines)
+                return _tail_log_file_sync(actual_log_path, lines)
+            except FileNotFoundError:
+                logger.warning(f"Attempted to read MCPO logs, but file not found: {actual_log_path}")
+                _close_log_reader_fd()
+                return [f"Error: Log file not found at path: {actual_log_path}"]
             except Exception as read_e:
                 logger.error(f"Error during log file read {actual_log_path} in thread: {read_e}", exc_info=True)
+                _close_log_reader_fd()
                 return [f"Error reading logs: {read_e}"]
 
+    try:
+        # Only the bounded tail is read, so a single executor hop per call is enough
         return await asyncio.to_thread(read_lines_sync)
-
     except Exception as e:
         logger.error(f"Error preparing to read log file {actual_log_path}: {e}", exc_info=True)
         return [f"Error preparing log read: {e}"]
 
+async def get_mcpo_log_increment(
+    offset: Optional[int], lines: int = 200, log_file_path: Optional[str] = None
+) -> Tuple[List[str], int, bool]:
+    """
+    Reads only what was appended to the MCPO log since `offset` (a value previously returned
+    by this function). See _read_log_since_sync for the meaning of the returned tuple.
+    """
+    actual_log_path = log_file_path or load_mcpo_settings().log_file_path
+    if not actual_log_path:
+        logger.warning("Attempted to read MCPO logs, but log file path is not configured.")
+        return ["Error: Log file path is not configured."], 0, True
+
+    def read_since_sync():
+        with _log_reader_lock:
+            try:
+                return _read_log_since_sync(actual_log_path, offset, lines)
+            except FileNotFoundError:
+                logger.warning(f"Attempted to read MCPO logs, but file not found: {actual_log_path}")
+                _close_log_reader_fd()
+                return [f"Error: Log file not found at path: {actual_log_path}"], 0, True
+            except Exception as read_e:
+                logger.error(f"Error during log file read {actual_log_path} in thread: {read_e}", exc_info=True)
+                _close_log_reader_fd()
+                return [f"Error reading logs: {read_e}"], 0, True
+
+    return await asyncio.to_thread(read_since_sync)
+
 # --- Tool Aggregation ---
-# (Remains unchanged, relies on get_mcpo_status and settings)
-async def get_aggregated_tools_from_mcpo(db_session: SQLModelSession) -> Dict[str, Any]:
+# Overall time budget for collecting OpenAPI specs from all servers
+TOOLS_AGGREGATION_DEADLINE_SECONDS = 8.0
+
+async def get_aggregated_tools_from_mcpo(db_session: SQLModelSession, settings: Optional[McpoSettings] = None) -> Dict[str, Any]:
     """
     Aggregates tools from the running MCPO instance.
     Returns a dictionary with status, a list of servers with their tools,
     and the public base URL for generating links.
+    Pass `settings` if the caller already loaded them.
     """
     logger.info("Aggregating tools from running MCPO instance...")
     mcpo_status = get_mcpo_status()
-    settings = load_mcpo_settings() # Load current settings
+    if settings is None:
+        settings = load_mcpo_settings() # Load current settings
 
     # Determine base URL for links in the UI
     base_url_for_links = ""
     if settings.public_base_url:
         base_url_for_links = settings.public_base_url.rstrip('/')
-        logger.debug(f"Using public base URL for links: {base_url_for_links}")
+        logger.debug("Using public base URL for links: %s", base_url_for_links)
     elif mcpo_status == "RUNNING": # Use local URL only if MCPO is running
         base_url_for_links = f"http://127.0.0.1:{settings.port}"
-        logger.debug(f"Public base URL not set, using local for links: {base_url_for_links}")
+        logger.debug("Public base URL not set, using local for links: %s", base_url_for_links)
     else:
          logger.debug("Public base URL not set, MCPO not running, links will not be generated.")
 
@@ -414,12 +624,14 @@ async def get_aggregated_tools_from_mcpo(db_session: SQLModelSession) -> Dict[st
     if settings.use_api_key and settings.api_key:
         headers["Authorization"] = f"Bearer {settings.api_key}"
 
-    # Get enabled server definitions from DB
-    enabled_definitions = get_server_definitions(db_session, only_enabled=True, limit=10000)
+    # Get enabled server definitions from DB (sync query, kept off the event loop)
+    enabled_definitions = await asyncio.to_thread(get_server_definitions, db_session, only_enabled=True, limit=10000)
     if not enabled_definitions:
         logger.info("No enabled server definitions found in the database.")
         return result
 
+    client = _get_http_client()
+
     # --- Nested async function to fetch OpenAPI spec for one server ---
     async def fetch_openapi(definition):
         server_name = definition.name
@@ -431,34 +643,33 @@ async def get_aggregated_tools_from_mcpo(db_session: SQLModelSession) -> Dict[st
         url = f"{mcpo_internal_api_url}/{server_name}/openapi.json"
         server_result_data = {"status": "ERROR", "error_message": None, "tools": []}
         try:
-            async with httpx.AsyncClient(headers=headers, timeout=10.0, follow_redirects=True) as client:
-                logger.debug(f"Requesting OpenAPI for server '{server_name}' at URL: {url}")
-                resp = await client.get(url)
-
-                if resp.status_code == 200:
-                    try:
-                        openapi_data = resp.json()
-                        paths = openapi_data.get("paths", {})
-                        found_tools = []
-                        for path, methods in paths.items():
-                            if post_method_details := methods.get("post"):
-                                tool_info = {
-                                    "path": path,
-                                    "summary": post_method_details.get("summary", ""),
-                                    "description": post_method_details.get("description", "")
-                                }
-                                found_tools.append(tool_info)
-                        server_result_data["tools"] = found_tools
-                        server_result_data["status"] = "OK"
-                        logger.debug(f"Server '{server_name}': Found {len(found_tools)} tools.")
-                    except json.JSONDecodeError as json_e:
-                         server_result_data["error_message"] = f"Error parsing JSON response from MCPO: {json_e}"
-                         logger.warning(f"Error parsing OpenAPI JSON for '{server_name}' (HTTP {resp.status_code}): {resp.text[:200]}...")
+            logger.debug("Requesting OpenAPI for server '%s' at URL: %s", server_name, url)
+            resp = await client.get(url, headers=headers, timeout=10.0)
 
-                else:
-                    error_text = resp.text[:200]
-                    server_result_data["error_message"] = f"MCPO Error (HTTP {resp.status_code}): {error_text}"
-                    logger.warning(f"Error requesting OpenAPI for '{server_name}' (HTTP {resp.status_code}): {error_text}")
+            if resp.status_code == 200:
+                try:
+                    openapi_data = resp.json()
+                    paths = openapi_data.get("paths", {})
+                    found_tools = []
+                    for path, methods in paths.items():
+                        if post_method_details := methods.get("post"):
+                            tool_info = {
+                                "path": path,
+                                "summary": post_method_details.get("summary", ""),
+                                "description": post_method_details.get("description", "")
+                            }
+                            found_tools.append(tool_info)
+                    server_result_data["tools"] = found_tools
+                    server_result_data["status"] = "OK"
+                    logger.debug("Server '%s': Found %d tools.", server_name, len(found_tools))
+                except json.JSONDecodeError as json_e:
+                     server_result_data["error_message"] = f"Error parsing JSON response from MCPO: {json_e}"
+                     logger.warning(f"Error parsing OpenAPI JSON for '{server_name}' (HTTP {resp.status_code}): {resp.text[:200]}...")
+
+            else:
+                error_text = resp.text[:200]
+                server_result_data["error_message"] = f"MCPO Error (HTTP {resp.status_code}): {error_text}"
+                logger.warning(f"Error requesting OpenAPI for '{server_name}' (HTTP {resp.status_code}): {error_text}")
 
         except httpx.RequestError as e:
             server_result_data["error_message"] = f"Network error: {e.__class__.__name__}"
@@ -470,14 +681,22 @@ async def get_aggregated_tools_from_mcpo(db_session: SQLModelSession) -> Dict[st
         return server_name, server_result_data
     # --- End of nested fetch_openapi function ---
 
-    # Start requests to all servers concurrently
-    tasks = [fetch_openapi(d) for d in enabled_definitions]
-    fetch_results = await asyncio.gather(*tasks, return_exceptions=True) # Gather results and exceptions
-
-    # Collect results into the final dictionary
-    for i, definition in enumerate(enabled_definitions):
-         server_name = definition.name
-         result_item = fetch_results[i]
+    # Start requests to all servers concurrently, bounded by one overall deadline
+    # so a single slow server cannot hold up the whole page.
+    tasks = {asyncio.create_task(fetch_openapi(d)): d.name for d in enabled_definitions}
+    _, pending = await asyncio.wait(tasks, timeout=TOOLS_AGGREGATION_DEADLINE_SECONDS)
+    for task in pending:
+        task.cancel() # Free the connection pool slots held by unfinished requests
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    # Collect results into the final dictionary (in definition order)
+    for task, server_name in tasks.items():
+         if task in pending:
+             logger.warning(f"OpenAPI request for '{server_name}' did not finish within {TOOLS_AGGREGATION_DEADLINE_SECONDS}s.")
+             result["servers"][server_name] = {"status": "TIMEOUT", "error_message": f"No response within {TOOLS_AGGREGATION_DEADLINE_SECONDS:g}s.", "tools": []}
+             continue
+         result_item = task.exception() or task.result()
          if isinstance(result_item, Exception):
              logger.error(f"Exception fetching OpenAPI for '{server_name}': {result_item}", exc_info=result_item)
              result["servers"][server_name] = {"status": "ERROR", "error_message": f"Exception: {result_item.__class__.__name__}", "tools": []}
@@ -486,36 +705,160 @@ async def get_aggregated_tools_from_mcpo(db_session: SQLModelSession) -> Dict[st
              _, server_result = result_item
              result["servers"][server_name] = server_result
          else:
-              logger.error(f"Unexpected result from asyncio.gather for '{server_name}': {result_item}")
+              logger.error(f"Unexpected result from OpenAPI fetch task for '{server_name}': {result_item}")
               result["servers"][server_name] = {"status": "ERROR", "error_message": "Unexpected internal result", "tools": []}
 
-    logger.info(f"Tool aggregation finished. Processed {len(enabled_definitions)} definitions.")
+    logger.info("Tool aggregation finished. Processed %d definitions.", len(enabled_definitions))
     return result
 
 # --- Health Check Logic ---
 
+# Built once; background tasks only read, so objects need not expire on commit
+_SessionFactory = sessionmaker(bind=engine, class_=SQLModelSession, expire_on_commit=False, autoflush=False)
+# [session, nesting depth, owning task] for the outermost get_async_db_session() in the current task
+_current_session: contextvars.ContextVar[Optional[List[Any]]] = contextvars.ContextVar("mcpo_bg_db_session", default=None)
+
 @contextlib.asynccontextmanager
-async def get_async_db_session(engine_to_use=engine):
-    """Async context manager for getting a DB session in background tasks."""
-    # This remains unchanged, it creates a session from the engine when needed
+async def get_async_db_session():
+    """
+    Async context manager for getting a DB session in background tasks.
+    Nested use within the same task reuses the outer session; only the outermost exit closes it.
+    """
+    current = _current_session.get()
+    # Child tasks inherit the context var but must not share the parent's session
+    if current is not None and current[2] is asyncio.current_task():
+        current[1] += 1
+        try:
+            yield current[0]
+        finally:
+            current[1] -= 1
+        return
+
     session = None
+    token = None
     try:
-        session = SQLModelSession(engine_to_use)
+        session = _SessionFactory()
+        token = _current_session.set([session, 1, asyncio.current_task()])
         yield session
     except Exception as e:
         logger.error(f"Error creating DB session in background task: {e}", exc_info=True)
         raise
     finally:
+        if token is not None:
+            _current_session.reset(token)
         if session:
             try:
-                session.close()
+                # Returning the connection to the pool is blocking I/O; keep it off the event loop
+                await asyncio.wait_for(asyncio.to_thread(session.close), timeout=5)
+            except asyncio.TimeoutError:
+                logger.warning("Closing DB session in background task took longer than 5s; continuing without waiting.")
             except Exception as e:
                 logger.error(f"Error closing DB session in background task: {e}", exc_info=True)
 
-async def run_health_check_loop_async(get_db_session_func: Callable):
+# --- Batched Background DB Operations ---
+_DB_BATCH_WINDOW_SECONDS = 0.05
+_DB_BATCH_MAX_OPS = 32
+_db_op_queue: Optional[asyncio.Queue] = None
+_db_worker_task: Optional[asyncio.Task] = None
+_BatchSessionFactory = sessionmaker(bind=batch_engine, class_=SQLModelSession, expire_on_commit=False, autoflush=False)
+
+def _run_db_batch_sync(session: SQLModelSession, ops: List[Callable[[SQLModelSession], Any]]) -> List[Tuple[bool, Any]]:
+    """
+    Runs queued callables against one session and commits once. Returns (ok, result_or_exception) per op.
+    Each op runs inside its own SAVEPOINT, so a failing op (including a failed flush) only discards its
+    own writes and leaves the session usable for the rest of the batch. `session` must be bound to batch_engine.
+    """
+    outcomes: List[Tuple[bool, Any]] = []
+    for op in ops:
+        savepoint = session.begin_nested()
+        try:
+            result = op(session)
+        except Exception as e:
+            # A failed flush deactivates the savepoint without closing it; it still has to be rolled back
+            if session.get_nested_transaction() is savepoint:
+                savepoint.rollback()
+            outcomes.append((False, e))
+            continue
+        if session.get_nested_transaction() is savepoint: # An op that committed on its own has already released it
+            savepoint.commit()
+        outcomes.append((True, result))
+    try:
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    return outcomes
+
+def _run_db_batch_in_own_session(ops: List[Callable[[SQLModelSession], Any]]) -> List[Tuple[bool, Any]]:
+    with _BatchSessionFactory() as session:
+        return _run_db_batch_sync(session, ops)
+
+async def _db_worker():
+    """Drains the DB op queue, running everything that arrives within the batch window in one session."""
+    while True:
+        batch = [await _db_op_queue.get()]
+        deadline = time.monotonic() + _DB_BATCH_WINDOW_SECONDS
+        while len(batch) < _DB_BATCH_MAX_OPS:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_db_op_queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        # Futures whose callers already gave up are dropped before touching the DB
+        batch = [(op, fut) for op, fut in batch if not fut.done()]
+        if not batch:
+            continue
+        logger.debug("DB worker: running batch of %d operation(s) in one session.", len(batch))
+        try:
+            outcomes = await asyncio.to_thread(_run_db_batch_in_own_session, [op for op, _ in batch])
+        except Exception as e:
+            logger.error(f"DB worker: batch of {len(batch)} operation(s) failed: {e}", exc_info=True)
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+            continue
+        for (_, fut), (ok, value) in zip(batch, outcomes):
+            if fut.done():
+                continue
+            if ok:
+                fut.set_result(value)
+            else:
+                fut.set_exception(value)
+
+async def submit_db_op(fn: Callable[[SQLModelSession], Any]) -> Any:
+    """
+    Queues fn(session) for the background DB worker and returns its result.
+    Operations submitted close together share one session checkout and one commit.
+    """
+    global _db_op_queue, _db_worker_task
+    if _db_op_queue is None:
+        _db_op_queue = asyncio.Queue()
+    if _db_worker_task is None or _db_worker_task.done():
+        # Fresh context: the worker must not inherit a session held by whichever task started it
+        _db_worker_task = asyncio.create_task(_db_worker(), context=contextvars.Context())
+    future = asyncio.get_running_loop().create_future()
+    await _db_op_queue.put((fn, future))
+    return await future
+
+async def stop_db_worker():
+    """Cancels the background DB worker (called on application shutdown)."""
+    global _db_worker_task
+    if _db_worker_task and not _db_worker_task.done():
+        _db_worker_task.cancel()
+        try:
+            await _db_worker_task
+        except asyncio.CancelledError:
+            pass
+        logger.info("Background DB worker stopped.")
+    _db_worker_task = None
+
+async def run_health_check_loop_async():
     """Asynchronous loop for periodic MCPO health checks."""
     # This loop remains largely the same, but relies on the new get_mcpo_status
-    global _health_check_failure_counter, _mcpo_manual_operation_in_progress
+    global _health_check_failure_counter, _health_check_failure_streak, _health_check_outage_started_at
     logger.info("Starting background MCPO health check loop...")
 
     await asyncio.sleep(10) # Initial delay
@@ -524,42 +867,48 @@ async def run_health_check_loop_async(get_db_session_func: Callable):
         try:
              settings = load_mcpo_settings()
         except Exception as e:
-             logger.error(f"Health Check: CRITICAL ERROR loading settings. Loop paused. Error: {e}", exc_info=True)
-             await asyncio.sleep(60)
+             logger.error("Health Check: CRITICAL ERROR loading settings. Loop paused. Error: %s", e, exc_info=True)
+             await _wait_for_next_health_check(60)
              continue
 
         if not settings.health_check_enabled:
             if _health_check_failure_counter > 0:
                 logger.info("Health Check: Check disabled, resetting failure counter.")
                 _health_check_failure_counter = 0
-            await asyncio.sleep(settings.health_check_interval_seconds)
+            _health_check_failure_streak = 0
+            _health_check_outage_started_at = None
+            await _wait_for_next_health_check(settings.health_check_interval_seconds)
             continue
 
-        # if _mcpo_manual_operation_in_progress:
-        #     logger.info("Health Check: Manual MCPO management detected, skipping check.")
-        #     await asyncio.sleep(max(1, settings.health_check_failure_retry_delay_seconds // 2))
-        #     continue
+        if _mcpo_lock.locked():
+            logger.info("Health Check: MCPO start/stop/restart in progress, skipping check.")
+            # start/stop wake the loop when they finish, so this wait usually ends early
+            await _wait_for_next_health_check(max(1, settings.health_check_failure_retry_delay_seconds // 2))
+            continue
 
         # Use the updated status check (no more ERROR state from PID files)
         mcpo_status = get_mcpo_status()
         if mcpo_status != "RUNNING":
-            logger.warning(f"Health Check: MCPO process not running (status: {mcpo_status}). Skipping HTTP check.")
+            logger.warning("Health Check: MCPO process not running (status: %s). Skipping HTTP check.", mcpo_status)
             # Only increment counter if the process is considered unhealthy by the health check itself
             # If status is STOPPED, reset the counter
             if mcpo_status == "STOPPED" and _health_check_failure_counter > 0:
-                 logger.info(f"Health Check: MCPO stopped, resetting failure counter.")
+                 logger.info("Health Check: MCPO stopped, resetting failure counter.")
                  _health_check_failure_counter = 0
+            if mcpo_status == "STOPPED":
+                 _health_check_failure_streak = 0
+                 _health_check_outage_started_at = None
             # Note: The 'ERROR' status is gone, so we don't handle it here anymore.
             # If the process reference exists but has exited (now reported as STOPPED),
             # the health check failure handler might trigger a restart if configured.
 
-            await asyncio.sleep(settings.health_check_interval_seconds)
+            await _wait_for_next_health_check(settings.health_check_interval_seconds)
             continue
 
         # Validate internal echo server settings
         if not settings.INTERNAL_ECHO_SERVER_NAME or not settings.INTERNAL_ECHO_TOOL_PATH:
              logger.error("Health Check: INTERNAL_ECHO_SERVER_NAME or INTERNAL_ECHO_TOOL_PATH not configured. Check cannot proceed.")
-             await asyncio.sleep(settings.health_check_interval_seconds * 2)
+             await _wait_for_next_health_check(settings.health_check_interval_seconds * 2)
              continue
 
         # Perform HTTP check (this part is unchanged)
@@ -570,81 +919,127 @@ async def run_health_check_loop_async(get_db_session_func: Callable):
             headers["Authorization"] = f"Bearer {settings.api_key}"
 
         try:
-            async with httpx.AsyncClient(headers=headers, timeout=20, follow_redirects=True) as client:
-                logger.debug(f"Health Check: Sending POST to {health_check_url} (timeout: {20}s)")
-                response = await client.post(health_check_url, json=payload)
+            logger.debug("Health Check: Sending POST to %s (timeout: %ss)", health_check_url, 20)
+            # Shared keep-alive client: consecutive ticks reuse the same connection
+            response = await _get_http_client().post(health_check_url, json=payload, headers=headers, timeout=20)
 
             if 200 <= response.status_code < 300:
                 if _health_check_failure_counter > 0:
-                    logger.info(f"Health Check: SUCCESS (Status: {response.status_code}). Failure counter reset.")
+                    logger.info("Health Check: SUCCESS (Status: %s). Failure counter reset.", response.status_code)
                 else:
-                     logger.debug(f"Health Check: Success (Status: {response.status_code}).")
+                     logger.debug("Health Check: Success (Status: %s).", response.status_code)
                 _health_check_failure_counter = 0
-                await asyncio.sleep(settings.health_check_interval_seconds)
+                _record_health_check_recovery()
+                _health_check_failure_streak = 0
+                await _wait_for_next_health_check(settings.health_check_interval_seconds)
             else:
-                logger.warning(f"Health Check: FAILURE (Status: {response.status_code}). URL: {health_check_url}. Response: {response.text[:200]}")
+                logger.warning("Health Check: FAILURE (Status: %s). URL: %s. Response: %.200s", response.status_code, health_check_url, response.text)
                 _health_check_failure_counter += 1
-                await handle_health_check_failure(settings, get_db_session_func)
+                await handle_health_check_failure(settings)
 
         except httpx.ConnectError as e:
-            logger.error(f"Health Check: Connection error requesting MCPO ({health_check_url}). Error: {e}")
+            logger.error("Health Check: Connection error requesting MCPO (%s). Error: %s", health_check_url, e)
             _health_check_failure_counter += 1
-            await handle_health_check_failure(settings, get_db_session_func)
+            await handle_health_check_failure(settings)
         except httpx.TimeoutException:
-            logger.error(f"Health Check: Timeout (20s) requesting MCPO ({health_check_url}).")
+            logger.error("Health Check: Timeout (20s) requesting MCPO (%s).", health_check_url)
             _health_check_failure_counter += 1
-            await handle_health_check_failure(settings, get_db_session_func)
+            await handle_health_check_failure(settings)
         except httpx.RequestError as e:
-            logger.error(f"Health Check: Network error requesting MCPO ({health_check_url}). Error: {e.__class__.__name__}: {e}")
+            logger.error("Health Check: Network error requesting MCPO (%s). Error: %s: %s", health_check_url, e.__class__.__name__, e)
             _health_check_failure_counter += 1
-            await handle_health_check_failure(settings, get_db_session_func)
+            await handle_health_check_failure(settings)
         except Exception as e:
-            logger.error(f"Health Check: Unexpected error ({health_check_url}). Error: {e.__class__.__name__}: {e}", exc_info=True)
+            logger.error("Health Check: Unexpected error (%s). Error: %s: %s", health_check_url, e.__class__.__name__, e, exc_info=True)
             _health_check_failure_counter += 1
-            await handle_health_check_failure(settings, get_db_session_func)
+            await handle_health_check_failure(settings)
+
+def _record_health_check_recovery():
+    """Called on a successful check; stores the outage duration if one was in progress."""
+    global _health_check_outage_started_at
+    if _health_check_failure_streak > 0 and _health_check_outage_started_at is not None:
+        _health_check_recovery_durations.append(time.monotonic() - _health_check_outage_started_at)
+    _health_check_outage_started_at = None
+
+def _adaptive_retry_delay(settings: McpoSettings) -> Optional[float]:
+    """
+    Delay until the lower quartile of the past recovery times still ahead of the current outage,
+    so successive retries step through the recovery-time distribution.
+    Returns None when there are too few samples or the outage already outlasted all of them.
+    """
+    if len(_health_check_recovery_durations) < _MIN_RECOVERY_SAMPLES or _health_check_outage_started_at is None:
+        return None
+    elapsed = time.monotonic() - _health_check_outage_started_at
+    remaining = sorted(d for d in _health_check_recovery_durations if d > elapsed)
+    if not remaining:
+        return None
+    delay = remaining[len(remaining) // 4] - elapsed
+    return min(max(1.0, delay), settings.health_check_max_backoff_seconds)
+
+def _failure_backoff_delay(settings: McpoSettings) -> float:
+    """Delay before the next check after a failure: adaptive if history allows, else retry delay grown by the backoff factor, capped."""
+    adaptive_delay = _adaptive_retry_delay(settings)
+    if adaptive_delay is not None:
+        return adaptive_delay
+    exponent = max(0, _health_check_failure_streak - 1)
+    try:
+        delay = settings.health_check_failure_retry_delay_seconds * (settings.health_check_backoff_base ** exponent)
+    except OverflowError:
+        delay = float(settings.health_check_max_backoff_seconds)
+    return min(delay, settings.health_check_max_backoff_seconds)
 
-async def handle_health_check_failure(settings: McpoSettings, get_db_session_func: Callable):
+async def handle_health_check_failure(settings: McpoSettings):
     """Handles a failed health check, deciding if a restart is needed."""
     # This function remains the same internally, relying on the updated restart logic
-    global _health_check_failure_counter, _mcpo_manual_operation_in_progress
+    global _health_check_failure_counter, _health_check_failure_streak, _health_check_outage_started_at
 
-    logger.info(f"Health Check: Failure attempt {_health_check_failure_counter} of {settings.health_check_failure_attempts}.")
+    if _health_check_failure_streak == 0:
+        _health_check_outage_started_at = time.monotonic()
+    _health_check_failure_streak += 1
+    logger.info("Health Check: Failure attempt %d of %d.", _health_check_failure_counter, settings.health_check_failure_attempts)
 
     if _health_check_failure_counter >= settings.health_check_failure_attempts:
-        logger.warning(f"Health Check: Reached maximum ({settings.health_check_failure_attempts}) failed check attempts.")
+        logger.warning("Health Check: Reached maximum (%d) failed check attempts.", settings.health_check_failure_attempts)
 
         if settings.auto_restart_on_failure:
             logger.info("Health Check: Auto-restart enabled. Attempting MCPO restart...")
 
             restart_success = False
-            restart_message = "Failed to get DB session for restart."
+            restart_message = "Restart did not complete."
             try:
-                # Get session using the async context manager
-                async with get_async_db_session() as db_session:
-                    if db_session:
-                        restart_success, restart_message = await restart_mcpo_process_with_new_config(db_session, settings)
-                    else:
-                         logger.error("Health Check: Failed to get DB session for restart. Auto-restart cancelled.")
+                # Config generation goes through the batched DB worker instead of holding a session for the whole restart
+                restart_success, restart_message = await restart_mcpo_process_with_new_config(None, settings)
             except Exception as e_db:
-                 logger.error(f"Health Check: Error getting DB session for restart: {e_db}", exc_info=True)
-                 restart_message = f"DB Session Error: {e_db}"
+                 logger.error("Health Check: Error during auto-restart: %s", e_db, exc_info=True)
+                 restart_message = f"Restart Error: {e_db}"
 
+            # The restart itself woke the loop via start/stop; don't treat that as an external signal
+            _hc_wakeup.clear()
             if restart_success:
-                logger.info(f"Health Check: MCPO successfully restarted after failures. Message: {restart_message}")
+                logger.info("Health Check: MCPO successfully restarted after failures. Message: %s", restart_message)
                 _health_check_failure_counter = 0
-                await asyncio.sleep(settings.health_check_interval_seconds)
+                await _wait_for_next_health_check(settings.health_check_interval_seconds)
             else:
-                logger.error(f"Health Check: Automatic MCPO restart FAILED after failures. Message: {restart_message}")
-                failed_restart_pause = settings.health_check_interval_seconds * 5
-                logger.warning(f"Health Check: Increased pause to {failed_restart_pause}s due to failed auto-restart.")
+                logger.error("Health Check: Automatic MCPO restart FAILED after failures. Message: %s", restart_message)
+                failed_restart_pause = max(settings.health_check_interval_seconds * 5, _failure_backoff_delay(settings))
+                logger.warning("Health Check: Increased pause to %.1fs due to failed auto-restart.", failed_restart_pause)
                 _health_check_failure_counter = 0
-                await asyncio.sleep(failed_restart_pause)
+                await _wait_for_next_health_check(failed_restart_pause)
 
         else: # auto_restart_on_failure is False
-            logger.info("Health Check: Auto-restart disabled. Manual intervention required to restore MCPO.")
+            logger.info("Health Check: Auto-restart disabled. Manual intervention required to restore MCPO. "
+                        "Checks paused until MCPO is started/stopped, settings change or checks are resumed via the API.")
             _health_check_failure_counter = 0
-            await asyncio.sleep(settings.health_check_interval_seconds)
+            # The manual wait is not an outage the checker recovered from; don't let it feed the recovery samples
+            _health_check_failure_streak = 0
+            _health_check_outage_started_at = None
+            _hc_resume_event.clear()
+            await _hc_resume_event.wait()
+            _hc_resume_event.clear()
+            _hc_wakeup.clear()
+            logger.info("Health Check: Resumed after manual intervention.")
     else:
         # Max attempts not yet reached
-        logger.info(f"Health Check: Waiting {settings.health_check_failure_retry_delay_seconds}s before next check attempt...")
-        await asyncio.sleep(settings.health_check_failure_retry_delay_seconds)
\ No newline at end of file
+        retry_delay = _failure_backoff_delay(settings)
+        logger.info("Health Check: Waiting %.1fs before next check attempt...", retry_delay)
+        await _wait_for_next_health_check(retry_delay)
\ No newline at end of file
@@ -5,6 +5,7 @@ import logging
 # and expose its 'router' instance and 'set_templates_for_ui_routers' function.
 from .routes import router as main_ui_aggregator_router
 from .routes import set_templates_for_ui_routers as main_set_templates_function
+from .routes import configure_templates
 
 # Make them available at the package level (mcpo_control_panel.ui.routes)
 router = main_ui_aggregator_router
@@ -13,7 +14,7 @@ set_templates_for_ui_routers = main_set_templates_function
 _init_logger = logging.getLogger(__name__)
 _init_logger.info(
     "Package mcpo_control_panel.ui.routes initialized, "
-    "exposing 'router' and 'set_templates_for_ui_routers' from its 'routes.py' module."
+    "exposing 'router', 'set_templates_for_ui_routers' and 'configure_templates' from its 'routes.py' module."
 )
 
-__all__ = ['router', 'set_templates_for_ui_routers']
\ No newline at end of file
+__all__ = ['router', 'set_templates_for_ui_routers', 'configure_templates']
\ No newline at end of file
@@ -1,21 +1,22 @@
 # mcpo_control_panel/ui/routers/main_ui_routes.py
-import html
 import logging
-import json
-import os
+import orjson
 from typing import Optional, Dict, Any, List, Tuple
-from urllib.parse import quote
 
 from fastapi import APIRouter, Request, Depends, Form, HTTPException
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
-from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 from sqlmodel import Session
 
 from ...db.database import get_session
+from .urls import url_for_cached
 from ...services import config_service, mcpo_service
+from ...services.config_service import deadapt_windows_command, normalize_server_fields
 from ...models.server_definition import (
-    ServerDefinitionCreate, ServerDefinitionUpdate, ServerDefinitionRead
+    ServerDefinitionCreate, ServerDefinitionUpdate
 )
 from ...models.mcpo_settings import McpoSettings
 
@@ -27,28 +28,52 @@ def set_templates_for_main_ui_routes(jinja_templates: Jinja2Templates):
     global templates
     templates = jinja_templates
 
-def _deadapt_windows_command(command: Optional[str], args: List[str]) -> Tuple[Optional[str], List[str]]:
-    if command == "cmd" and args and args[0].lower() == "/c" and len(args) > 1:
-        executable = args[1].lower()
-        if executable == "npx":
-            args_start_index = 2
-            if len(args) > 2 and args[2] == "-y":
-                args_start_index = 3
-            new_command = "npx"
-            new_args = args[args_start_index:]
-            return new_command, new_args
-        elif executable == "uvx":
-            new_command = "uvx"
-            new_args = args[2:]
-            return new_command, new_args
-        elif executable == "docker":
-            new_command = "docker"
-            if len(args) > 2 and args[2].lower() == "run":
-                 new_args = args[3:]
+# Compiled once; serialises the analyzed definitions straight to JSON bytes and validates the confirmed list in one pass
+_SERVER_CREATE_LIST_ADAPTER = TypeAdapter(List[ServerDefinitionCreate])
+
+INDEX_PAGE_SERVER_LIMIT = 100 # Rows materialised for the index table
+
+_strip = str.strip
+
+def _nonblank_args(arg_items: List[str]) -> List[str]:
+    """Drops blank argument rows; non-blank args are kept verbatim (surrounding spaces may be intentional)."""
+    return list(filter(_strip, arg_items)) # str.strip as the predicate: keeps the original, unstripped values
+
+def _env_vars_from_form(env_keys: List[str], env_values: List[str]) -> Optional[Dict[str, str]]:
+    """Builds the env dict from the paired form lists, skipping blank keys. Returns None if the lists differ in length."""
+    if len(env_keys) != len(env_values):
+        return None
+    return {key: _strip(value) for key, value in zip(map(_strip, env_keys), env_values) if key}
+
+class _ServerForm(BaseModel):
+    """Fields posted by the single-add and edit server forms, read from one request.form() call."""
+    name: str
+    server_type: str
+    is_enabled: bool = False
+    command: Optional[str] = None
+    url: Optional[str] = None
+    arg_items: List[str] = Field(default_factory=list, alias="arg_item[]")
+    env_keys: List[str] = Field(default_factory=list, alias="env_key[]")
+    env_values: List[str] = Field(default_factory=list, alias="env_value[]")
+
+    @classmethod
+    async def as_form(cls, request: Request) -> "_ServerForm":
+        form = await request.form()
+        data: Dict[str, Any] = {}
+        for field_name, field in cls.model_fields.items():
+            key = field.alias or field_name
+            if key.endswith("[]"):
+                data[key] = form.getlist(key)
             else:
-                 new_args = args[2:]
-            return new_command, new_args
-    return command, args
+                value = form.get(key)
+                if value not in (None, ""): # Blank scalars count as missing, as with Form(...)
+                    data[key] = value
+        try:
+            return cls.model_validate(data)
+        except ValidationError as e:
+            raise RequestValidationError(
+                [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+            )
 
 @router.get("/", response_class=HTMLResponse, name="ui_root")
 async def get_index_page(
@@ -63,15 +88,20 @@ async def get_index_page(
     if not templates:
         raise HTTPException(status_code=500, detail="Templates not configured for main UI router")
 
-    server_definitions = config_service.get_server_definitions(db)
-    definitions_read = [ServerDefinitionRead.model_validate(d) for d in server_definitions]
+    # Sync SQLModel session: run DB calls in the threadpool so the event loop is not blocked
+    server_definitions = await run_in_threadpool(config_service.get_server_definitions, db, limit=INDEX_PAGE_SERVER_LIMIT)
+    # The list is capped by get_server_definitions' limit; a COUNT tells the template whether rows were left out
+    server_total_count = len(server_definitions)
+    if server_total_count >= INDEX_PAGE_SERVER_LIMIT:
+        server_total_count = await run_in_threadpool(config_service.count_server_definitions, db)
     current_mcpo_status = mcpo_service.get_mcpo_status()
     mcpo_settings = config_service.load_mcpo_settings()
 
     return templates.TemplateResponse(
         "index.html", {
             "request": request,
-            "server_definitions": definitions_read,
+            "server_definitions": server_definitions, # ORM rows expose the same attributes the template reads
+            "server_total_count": server_total_count,
             "mcpo_status": current_mcpo_status,
             "mcpo_settings": mcpo_settings,
             "single_add_success_msg": single_add_success,
@@ -91,7 +121,7 @@ async def get_tools_page(request: Request, db: Session = Depends(get_session)):
     error_message: Optional[str] = None
     
     try:
-        tools_data = await mcpo_service.get_aggregated_tools_from_mcpo(db)
+        tools_data = await mcpo_service.get_aggregated_tools_from_mcpo(db, mcpo_settings)
     except Exception as e:
         logger.error(f"Error getting aggregated tool data: {e}", exc_info=True)
         error_message = "An error occurred while retrieving tool information."
@@ -119,7 +149,7 @@ async def show_logs_page(
         raise HTTPException(status_code=500, detail="Templates not configured for main UI router")
 
     log_file_path_exists = False
-    if settings.log_file_path and os.path.exists(settings.log_file_path):
+    if settings.log_file_path and mcpo_service.path_exists_cached(settings.log_file_path): # Short TTL cache shared with MCPO start
         log_file_path_exists = True
     elif settings.log_file_path:
         logger.warning(f"Log file path configured ('{settings.log_file_path}') but file does not exist.")
@@ -138,12 +168,12 @@ async def get_edit_server_form(request: Request, server_id: int, db: Session = D
         raise HTTPException(status_code=500, detail="Templates not configured for main UI router")
     
     mcpo_settings = config_service.load_mcpo_settings() # Load settings
-    definition_db = config_service.get_server_definition(db, server_id)
+    definition_db = await run_in_threadpool(config_service.get_server_definition, db, server_id)
     if not definition_db:
         raise HTTPException(status_code=404, detail="Server definition not found")
     
-    definition_data = ServerDefinitionRead.model_validate(definition_db).model_dump()
-    action_url = request.url_for("ui_update_server", server_id=server_id)
+    definition_data = definition_db.model_dump() # Trusted DB row; re-validating through ServerDefinitionRead is redundant
+    action_url = url_for_cached(request, "ui_update_server", server_id=server_id)
     form_title = f"Editing '{definition_data.get('name', '')}'"
     submit_button_text = "Update Definition"
     
@@ -154,71 +184,53 @@ async def get_edit_server_form(request: Request, server_id: int, db: Session = D
         "server_data": definition_data,
         "form_title": form_title,
         "is_add_form": False,
-        "cancel_url": request.url_for("ui_root"),
+        "cancel_url": url_for_cached(request, "ui_root"),
         "mcpo_settings": mcpo_settings # Pass settings for base.html
     })
 
 @router.post("/servers/{server_id}/edit", name="ui_update_server")
 async def handle_update_server_form(
     request: Request, server_id: int, db: Session = Depends(get_session),
-    name: str = Form(...),
-    server_type: str = Form(...),
-    is_enabled: bool = Form(False),
-    command: Optional[str] = Form(None),
-    url: Optional[str] = Form(None),
-    arg_items: List[str] = Form([], alias="arg_item[]"),
-    env_keys: List[str] = Form([], alias="env_key[]"),
-    env_values: List[str] = Form([], alias="env_value[]")
+    form: _ServerForm = Depends(_ServerForm.as_form)
 ):
     if not templates:
         raise HTTPException(status_code=500, detail="Templates not configured for main UI router")
+    name, server_type, is_enabled = form.name, form.server_type, form.is_enabled
+    command, url = form.command, form.url
+    arg_items, env_keys, env_values = form.arg_items, form.env_keys, form.env_values
     
     mcpo_settings = config_service.load_mcpo_settings() # Load settings for potential error re-render
-    logger.info(f"UI Request: POST /servers/{server_id}/edit (Updating server)")
-    processed_args: List[str] = [arg for arg in arg_items if arg.strip()]
-    processed_env_vars: Dict[str, str] = {}
-    if len(env_keys) == len(env_values):
-        for key, value in zip(env_keys, env_values):
-            if key_stripped := key.strip():
-                processed_env_vars[key_stripped] = value.strip()
-    else:
+    logger.info("UI Request: POST /servers/%s/edit (Updating server)", server_id)
+    processed_args = _nonblank_args(arg_items)
+    processed_env_vars = _env_vars_from_form(env_keys, env_values)
+    if processed_env_vars is None:
         logger.warning(f"Mismatch in env_keys and env_values updating server ID {server_id}")
+        processed_env_vars = {}
 
     current_command = command if command and command.strip() else None
     current_url = url if url and url.strip() else None
     final_args = processed_args
     final_env_vars = processed_env_vars
-    error_msg: Optional[str] = None
-    current_command, final_args = _deadapt_windows_command(current_command, final_args)
-
-    if server_type == 'stdio':
-        current_url = None
-    elif server_type in ['sse', 'streamable_http']:
-        current_command = None
-        final_args = []
-        final_env_vars = {}
-    else:
-        error_msg = "Unknown server type."
-
-    if not error_msg:
-        if server_type == 'stdio' and not current_command:
-            error_msg = "The 'Command' field is mandatory for type 'stdio'."
-        elif server_type in ['sse', 'streamable_http'] and not current_url:
-            error_msg = f"The 'URL' field is mandatory for type '{server_type}'."
-
-    form_data_on_error = {
-        "id": server_id, "name": name, "server_type": server_type, "is_enabled": is_enabled,
-        "command": current_command, "args": final_args, "env_vars": final_env_vars, "url": current_url
-    }
-    action_url = request.url_for("ui_update_server", server_id=server_id)
+    current_command, final_args = deadapt_windows_command(current_command, final_args)
+    current_command, current_url, final_args, final_env_vars, error_msg = normalize_server_fields(
+        server_type, current_command, current_url, final_args, final_env_vars
+    )
+
+    def form_data_on_error() -> Dict[str, Any]: # Only built when a branch re-renders the form
+        return {
+            "id": server_id, "name": name, "server_type": server_type, "is_enabled": is_enabled,
+            "command": current_command, "args": final_args, "env_vars": final_env_vars, "url": current_url
+        }
+    action_url = url_for_cached(request, "ui_update_server", server_id=server_id)
+    cancel_url = url_for_cached(request, "ui_root")
     form_title = f"Editing '{name}' (Error)"
     submit_button_text = "Update Definition"
 
     if error_msg:
         return templates.TemplateResponse("edit_server_page.html", {
             "request": request, "action_url": action_url, "submit_button_text": submit_button_text,
-            "server_data": form_data_on_error, "form_title": form_title, "is_add_form": False,
-            "error": error_msg, "cancel_url": request.url_for("ui_root"),
+            "server_data": form_data_on_error(), "form_title": form_title, "is_add_form": False,
+            "error": error_msg, "cancel_url": cancel_url,
             "mcpo_settings": mcpo_settings # Pass settings
             }, status_code=400)
     try:
@@ -226,35 +238,54 @@ async def handle_update_server_form(
             name=name, server_type=server_type, is_enabled=is_enabled, command=current_command,
             args=final_args, env_vars=final_env_vars, url=current_url
         )
-        updated = config_service.update_server_definition(db=db, server_id=server_id, definition_in=definition_in)
+        updated = await run_in_threadpool(
+            config_service.update_server_definition, db=db, server_id=server_id, definition_in=definition_in
+        )
         if not updated:
             return templates.TemplateResponse("edit_server_page.html", {
                 "request": request, "action_url": action_url, "submit_button_text": submit_button_text,
-                "server_data": form_data_on_error, "form_title": f"Editing '{name}' (Not Found)",
+                "server_data": form_data_on_error(), "form_title": f"Editing '{name}' (Not Found)",
                 "is_add_form": False, "error": "Server definition not found for update.",
-                "cancel_url": request.url_for("ui_root"),
+                "cancel_url": cancel_url,
                 "mcpo_settings": mcpo_settings # Pass settings
                 }, status_code=404)
-        redirect_url = str(request.url_for("ui_root")) + f"?update_success={quote(updated.name)}"
+        redirect_url = str(cancel_url.include_query_params(update_success=updated.name))
         return RedirectResponse(url=redirect_url, status_code=303)
     except (ValueError, ValidationError) as e:
         error_text = f"Failed to update: {str(e)}"
         return templates.TemplateResponse("edit_server_page.html", {
             "request": request, "action_url": action_url, "submit_button_text": submit_button_text,
-            "server_data": form_data_on_error, "form_title": form_title, "is_add_form": False,
-            "error": error_text, "cancel_url": request.url_for("ui_root"),
+            "server_data": form_data_on_error(), "form_title": form_title, "is_add_form": False,
+            "error": error_text, "cancel_url": cancel_url,
             "mcpo_settings": mcpo_settings # Pass settings
             }, status_code=400)
     except Exception as e:
         logger.error(f"Unexpected error updating server ID {server_id}: {e}", exc_info=True)
         return templates.TemplateResponse("edit_server_page.html", {
              "request": request, "action_url": action_url, "submit_button_text": submit_button_text,
-             "server_data": form_data_on_error, "form_title": f"Editing '{name}' (Server Error)",
+             "server_data": form_data_on_error(), "form_title": f"Editing '{name}' (Server Error)",
              "is_add_form": False, "error": "Unexpected server error.",
-             "cancel_url": request.url_for("ui_root"),
+             "cancel_url": cancel_url,
              "mcpo_settings": mcpo_settings # Pass settings
              }, status_code=500)
 
+def _render_add_servers_page(
+    request: Request,
+    mcpo_settings: McpoSettings,
+    single_server_form_data: Optional[Dict[str, Any]] = None,
+    single_server_error: Optional[str] = None,
+    status_code: int = 200,
+):
+    """Renders add_servers_page.html; shared by the GET page and the single-add error branches."""
+    return templates.TemplateResponse("add_servers_page.html", {
+        "request": request,
+        "single_add_action_url": url_for_cached(request, "ui_add_single_server"),
+        "bulk_analyze_action_url": url_for_cached(request, "ui_analyze_bulk_servers"),
+        "single_server_form_data": single_server_form_data or {},
+        "single_server_error": single_server_error,
+        "mcpo_settings": mcpo_settings # Pass settings for base.html
+    }, status_code=status_code)
+
 @router.get("/servers/add", response_class=HTMLResponse, name="ui_add_servers_form")
 async def get_add_servers_page(
     request: Request,
@@ -265,100 +296,62 @@ async def get_add_servers_page(
         raise HTTPException(status_code=500, detail="Templates not configured for main UI router")
     
     mcpo_settings = config_service.load_mcpo_settings() # Load settings
-    single_add_action_url = request.url_for("ui_add_single_server")
-    bulk_analyze_action_url = request.url_for("ui_analyze_bulk_servers")
-    
-    return templates.TemplateResponse("add_servers_page.html", {
-        "request": request,
-        "single_add_action_url": single_add_action_url,
-        "bulk_analyze_action_url": bulk_analyze_action_url,
-        "single_server_form_data": single_server_form_data or {},
-        "single_server_error": single_server_error,
-        "mcpo_settings": mcpo_settings # Pass settings
-    })
+    return _render_add_servers_page(request, mcpo_settings, single_server_form_data, single_server_error)
 
 @router.post("/servers/add_single", name="ui_add_single_server")
 async def handle_add_single_server_form(
     request: Request, db: Session = Depends(get_session),
-    name: str = Form(...), server_type: str = Form(...), is_enabled: bool = Form(False),
-    command: Optional[str] = Form(None), url: Optional[str] = Form(None),
-    arg_items: List[str] = Form([], alias="arg_item[]"),
-    env_keys: List[str] = Form([], alias="env_key[]"),
-    env_values: List[str] = Form([], alias="env_value[]")
+    form: _ServerForm = Depends(_ServerForm.as_form)
 ):
     if not templates:
         raise HTTPException(status_code=500, detail="Templates not configured for main UI router")
+    name, server_type, is_enabled = form.name, form.server_type, form.is_enabled
+    command, url = form.command, form.url
+    arg_items, env_keys, env_values = form.arg_items, form.env_keys, form.env_values
     
     mcpo_settings = config_service.load_mcpo_settings() # Load settings for potential error re-render
-    logger.info(f"UI Request: POST /servers/add_single (Adding server '{name}')")
-    processed_args: List[str] = [arg for arg in arg_items if arg.strip()]
-    processed_env_vars: Dict[str, str] = {}
-    if len(env_keys) == len(env_values):
-        for key, value in zip(env_keys, env_values):
-            if key_stripped := key.strip():
-                processed_env_vars[key_stripped] = value.strip()
-    else:
+    logger.info("UI Request: POST /servers/add_single (Adding server '%s')", name)
+    processed_args = _nonblank_args(arg_items)
+    processed_env_vars = _env_vars_from_form(env_keys, env_values)
+    if processed_env_vars is None:
         logger.warning("Mismatch in env_keys and env_values when adding server")
+        processed_env_vars = {}
 
     final_command = command if command and command.strip() else None
     final_args = processed_args
     final_env_vars = processed_env_vars
     final_url = url if url and url.strip() else None
-    error_msg: Optional[str] = None
-    final_command, final_args = _deadapt_windows_command(final_command, final_args)
-
-    if server_type == 'stdio':
-        final_url = None
-        if not final_command: error_msg = "The 'Command' field is mandatory for type 'stdio'."
-    elif server_type in ['sse', 'streamable_http']:
-        final_command = None; final_args = []; final_env_vars = {}
-        if not final_url: error_msg = f"The 'URL' field is mandatory for type '{server_type}'."
-    else:
-        error_msg = "Unknown server type."
+    final_command, final_args = deadapt_windows_command(final_command, final_args)
+    final_command, final_url, final_args, final_env_vars, error_msg = normalize_server_fields(
+        server_type, final_command, final_url, final_args, final_env_vars
+    )
 
-    form_data_on_error = {
-        "name": name, "server_type": server_type, "is_enabled": is_enabled,
-        "command": final_command, "args": final_args, "env_vars": final_env_vars, "url": final_url
-    }
-    single_add_action_url = request.url_for("ui_add_single_server")
-    bulk_analyze_action_url = request.url_for("ui_analyze_bulk_servers")
+    def form_data_on_error() -> Dict[str, Any]: # Only built when a branch re-renders the form
+        return {
+            "name": name, "server_type": server_type, "is_enabled": is_enabled,
+            "command": final_command, "args": final_args, "env_vars": final_env_vars, "url": final_url
+        }
 
     if error_msg:
         logger.warning(f"Validation error adding server '{name}': {error_msg}")
-        return templates.TemplateResponse("add_servers_page.html", {
-            "request": request, "single_add_action_url": single_add_action_url,
-            "bulk_analyze_action_url": bulk_analyze_action_url,
-            "single_server_form_data": form_data_on_error,
-            "single_server_error": error_msg,
-            "mcpo_settings": mcpo_settings # Pass settings
-            }, status_code=400)
+        return _render_add_servers_page(request, mcpo_settings, form_data_on_error(), error_msg, status_code=400)
     try:
         definition_in = ServerDefinitionCreate(
             name=name, server_type=server_type, is_enabled=is_enabled,
             command=final_command, args=final_args, env_vars=final_env_vars, url=final_url
         )
-        created = config_service.create_server_definition(db=db, definition_in=definition_in)
-        redirect_url = str(request.url_for("ui_root")) + f"?single_add_success={quote(created.name)}"
+        created = await run_in_threadpool(config_service.create_server_definition, db=db, definition_in=definition_in)
+        redirect_url = str(url_for_cached(request, "ui_root").include_query_params(single_add_success=created.name))
         return RedirectResponse(url=redirect_url, status_code=303)
     except (ValueError, ValidationError) as e:
         error_text = f"Failed to add server: {str(e)}"
         logger.warning(f"Error adding server '{name}': {error_text}")
-        return templates.TemplateResponse("add_servers_page.html", {
-            "request": request, "single_add_action_url": single_add_action_url,
-            "bulk_analyze_action_url": bulk_analyze_action_url,
-            "single_server_form_data": form_data_on_error,
-            "single_server_error": error_text,
-            "mcpo_settings": mcpo_settings # Pass settings
-            }, status_code=400)
+        return _render_add_servers_page(request, mcpo_settings, form_data_on_error(), error_text, status_code=400)
     except Exception as e:
         logger.error(f"Unexpected error adding server '{name}': {e}", exc_info=True)
-        return templates.TemplateResponse("add_servers_page.html", {
-             "request": request, "single_add_action_url": single_add_action_url,
-             "bulk_analyze_action_url": bulk_analyze_action_url,
-             "single_server_form_data": form_data_on_error,
-             "single_server_error": "Unexpected server error during addition.",
-             "mcpo_settings": mcpo_settings # Pass settings
-             }, status_code=500)
+        return _render_add_servers_page(
+            request, mcpo_settings, form_data_on_error(), "Unexpected server error during addition.", status_code=500
+        )
 
 @router.post("/servers/analyze-bulk", response_class=HTMLResponse, name="ui_analyze_bulk_servers")
 async def handle_analyze_bulk_servers(
@@ -370,14 +363,14 @@ async def handle_analyze_bulk_servers(
         raise HTTPException(status_code=500, detail="Templates not configured for main UI router")
     
     logger.info("UI Request: POST /servers/analyze-bulk (Analyzing JSON for bulk add)")
-    analysis_result, parsing_errors = config_service.analyze_bulk_server_definitions(
+    analysis_result, parsing_errors = await run_in_threadpool(
+        config_service.analyze_bulk_server_definitions,
         db=db, config_json_str=config_json_str, default_enabled=default_enabled
     )
     serialized_valid_servers = "[]"
     if analysis_result["valid_new"]:
         try:
-            valid_new_dicts = [server.model_dump(mode='json') for server in analysis_result["valid_new"]]
-            serialized_valid_servers = json.dumps(valid_new_dicts)
+            serialized_valid_servers = _SERVER_CREATE_LIST_ADAPTER.dump_json(analysis_result["valid_new"]).decode("utf-8")
         except Exception as e:
             logger.error(f"Error serializing valid server data for confirmation: {e}", exc_info=True)
             parsing_errors.append("Internal error: Failed to prepare valid data for confirmation.")
@@ -389,7 +382,7 @@ async def handle_analyze_bulk_servers(
     return templates.TemplateResponse("_bulk_add_preview.html", {
         "request": request, "analysis": analysis_result, "parsing_errors": parsing_errors,
         "serialized_valid_servers": serialized_valid_servers,
-        "confirm_action_url": request.url_for("ui_confirm_bulk_add")
+        "confirm_action_url": url_for_cached(request, "ui_confirm_bulk_add")
         # "mcpo_settings": config_service.load_mcpo_settings() # If _bulk_add_preview.html ever needs it for base
     })
 
@@ -402,39 +395,63 @@ async def handle_confirm_bulk_add(
     if not templates:
         raise HTTPException(status_code=500, detail="Templates not configured for main UI router")
         
-    logger.info(f"UI Request: POST /servers/confirm-bulk-add (Confirming bulk add)")
+    logger.info("UI Request: POST /servers/confirm-bulk-add (Confirming bulk add)")
+    root_url = url_for_cached(request, "ui_root")
     added_count = 0
     errors: List[str] = []
     try:
-        servers_to_add_data = json.loads(valid_new_servers_json)
+        servers_to_add_data = orjson.loads(valid_new_servers_json)
         if not isinstance(servers_to_add_data, list):
             raise ValueError("Invalid payload format: Expected a list of server definitions.")
         if not servers_to_add_data:
-             redirect_url = str(request.url_for("ui_root")) + "?bulk_info=No new servers were available to add."
+             redirect_url = str(root_url.include_query_params(bulk_info="No new servers were available to add."))
              return RedirectResponse(url=redirect_url, status_code=303)
-        logger.info(f"Attempting to add {len(servers_to_add_data)} servers from confirmed list.")
-        for server_data in servers_to_add_data:
-            server_name = server_data.get("name", "Unknown")
+        logger.info("Attempting to add %d servers from confirmed list.", len(servers_to_add_data))
+        definitions_to_create: List[ServerDefinitionCreate] = []
+        try:
+            definitions_to_create = _SERVER_CREATE_LIST_ADAPTER.validate_python(servers_to_add_data)
+        except ValidationError:
+            # Only a tampered payload gets here; redo it per entry so each bad server gets its own message
+            for server_data in servers_to_add_data:
+                server_name = server_data.get("name", "Unknown") if isinstance(server_data, dict) else "Unknown"
+                try:
+                    definitions_to_create.append(ServerDefinitionCreate(**server_data))
+                except (ValidationError, ValueError, TypeError) as e:
+                     msg = f"Error adding '{server_name}' during confirmation: {str(e)}"
+                     errors.append(msg)
+                     logger.warning(msg)
+
+        # Names taken since the analysis step (or repeated in the payload) are reported per server, the rest go in one transaction
+        existing_names = await run_in_threadpool(
+            config_service.get_existing_server_names, db, [d.name for d in definitions_to_create]
+        )
+        seen_names: set[str] = set()
+        unique_definitions: List[ServerDefinitionCreate] = []
+        for definition_in in definitions_to_create:
+            if definition_in.name in existing_names or definition_in.name in seen_names:
+                msg = f"Error adding '{definition_in.name}' during confirmation: Server definition with name '{definition_in.name}' already exists."
+                errors.append(msg)
+                logger.warning(msg)
+                continue
+            seen_names.add(definition_in.name)
+            unique_definitions.append(definition_in)
+
+        if unique_definitions:
             try:
-                definition_in = ServerDefinitionCreate(**server_data)
-                config_service.create_server_definition(db=db, definition_in=definition_in)
-                added_count += 1
-            except (ValidationError, ValueError) as e:
-                 msg = f"Error adding '{server_name}' during confirmation: {str(e)}"
-                 errors.append(msg)
-                 logger.warning(msg)
+                created = await run_in_threadpool(config_service.create_server_definitions_bulk, db, unique_definitions)
+                added_count = len(created)
             except Exception as e:
-                 msg = f"Unexpected error adding '{server_name}' during confirmation: {str(e)}"
+                 db.rollback()
+                 msg = f"Unexpected error adding {len(unique_definitions)} servers during confirmation: {str(e)}"
                  errors.append(msg)
                  logger.error(msg, exc_info=True)
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         errors.append(f"Failed to parse server data for confirmation: {e}")
         logger.error(f"JSON decode error during bulk confirmation: {e}")
     except Exception as e:
         errors.append(f"Unexpected error during confirmation process: {e}")
         logger.error(f"Unexpected error during bulk confirmation: {e}", exc_info=True)
 
-    redirect_url_str = str(request.url_for("ui_root"))
     query_params = {}
     if added_count > 0:
         query_params["bulk_success"] = str(added_count)
@@ -445,7 +462,5 @@ async def handle_confirm_bulk_add(
          error_summary = f"Failed to add servers during confirmation (Errors: {len(errors)} - see logs)."
          query_params["bulk_error"] = error_summary
     
-    if query_params:
-        encoded_params = "&".join(f"{k}={quote(str(v))}" for k, v in query_params.items())
-        redirect_url_str += f"?{encoded_params}"
-    return RedirectResponse(url=redirect_url_str, status_code=303)
\ No newline at end of file
+    redirect_url = root_url.include_query_params(**query_params) if query_params else root_url
+    return RedirectResponse(url=str(redirect_url), status_code=303)
\ No newline at end of file
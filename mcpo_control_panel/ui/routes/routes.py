@@ -1,17 +1,57 @@
 # mcpo_control_panel/ui/routes/routes.py (Main UI Router Aggregator)
 import logging
+import os
+from pathlib import Path
 from fastapi import APIRouter
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache, TemplateNotFound
 from typing import Optional
 
 # Import the sub-router *modules*. Their router instances will be accessed via these module objects.
 from . import main_ui_routes as main_ui_module
 from . import settings_routes as settings_ui_module
+from .urls import jinja_url_for
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter() # This is the router instance that this module provides.
 
+def _get_jinja_cache_dir() -> Path:
+    """JINJA_CACHE_DIR if set, otherwise a 'jinja_cache' folder inside the manager data directory."""
+    cache_dir = os.getenv("JINJA_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir)
+    data_dir = Path(os.getenv("MCPO_MANAGER_DATA_DIR_EFFECTIVE", Path.home() / ".mcpo_manager_data"))
+    return data_dir / "jinja_cache"
+
+def configure_templates(jinja_templates: Jinja2Templates):
+    """
+    Tunes the Jinja2 environment for serving: no per-render mtime checks, a persistent
+    bytecode cache and an unbounded in-memory template cache, then preloads every template.
+    """
+    env = jinja_templates.env
+    env.auto_reload = False
+    env.globals["url_for"] = jinja_url_for # Memoised route lookup; templates call url_for per row
+    # The environment builds its cache from cache_size at construction; swap it before anything is loaded.
+    # A plain dict is what Jinja itself uses for cache_size=-1; the template directory is small and fixed.
+    env.cache = {}
+    cache_dir = _get_jinja_cache_dir()
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        env.bytecode_cache = FileSystemBytecodeCache(str(cache_dir))
+        logger.info(f"Jinja2 bytecode cache enabled in '{cache_dir}'.")
+    except OSError as e:
+        logger.warning(f"Could not create Jinja2 bytecode cache directory '{cache_dir}': {e}. Continuing without it.")
+
+    # Pages, partials and macro files alike, so included/imported templates are resident too
+    template_names = env.list_templates(extensions=["html"])
+    for template_name in template_names:
+        try:
+            env.get_template(template_name)
+        except TemplateNotFound:
+            logger.warning(f"Template '{template_name}' not found while preloading.")
+    logger.info(f"Preloaded {len(template_names)} Jinja2 templates.")
+
 # This function is called by mcpo_control_panel.ui.routes.__init__
 # which in turn is called by main.py
 def set_templates_for_ui_routers(jinja_templates: Jinja2Templates):
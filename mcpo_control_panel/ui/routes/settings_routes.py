@@ -1,32 +1,59 @@
 # mcpo_control_panel/ui/routers/settings_routes.py
+import hashlib
 import logging
-from typing import Optional
+import time
+from typing import Any, Dict, Optional
 from fastapi import APIRouter, Request, Depends, Form, HTTPException
+from fastapi.responses import RedirectResponse, Response
 from fastapi.templating import Jinja2Templates
+from starlette.concurrency import run_in_threadpool
 
-from ...services import config_service
+from ...services import config_service, mcpo_service
 from ...models.mcpo_settings import McpoSettings
+from .urls import url_for_cached
 from pydantic import ValidationError
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
+
+SETTINGS_SAVED_MESSAGE = "MCPO settings successfully updated."
 templates: Optional[Jinja2Templates] = None 
 
 def set_templates_for_settings_routes(jinja_templates: Jinja2Templates):
     global templates
     templates = jinja_templates
 
+# Mixed into every ETag so a restart (new release, edited templates) never matches a page cached by the browser
+_SETTINGS_PAGE_ETAG_SEED = str(time.time_ns()).encode()
+
+def _settings_page_etag(request: Request, settings: McpoSettings) -> str:
+    """The settings page is fully determined by the settings and the query string."""
+    digest = hashlib.blake2b(_SETTINGS_PAGE_ETAG_SEED, digest_size=16)
+    digest.update(settings.model_dump_json().encode())
+    digest.update(request.url.query.encode())
+    return f'"{digest.hexdigest()}"'
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return any(tag.strip().removeprefix("W/") in (etag, "*") for tag in if_none_match.split(","))
+
 @router.get("/settings", response_class="HTMLResponse", name="ui_edit_mcpo_settings_form")
-async def get_mcpo_settings_form(request: Request):
+async def get_mcpo_settings_form(request: Request, saved: bool = False):
     if not templates:
         raise HTTPException(status_code=500, detail="Templates not configured for settings routes")
     settings = config_service.load_mcpo_settings()
+    etag = _settings_page_etag(request, settings)
+    cache_headers = {"ETag": etag, "Cache-Control": "no-cache"} # Browser keeps the page but revalidates each time
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=cache_headers)
     return templates.TemplateResponse("mcpo_settings_form.html", {
         "request": request,
         "settings": settings.model_dump(), # Pass current settings for display
         "error": None,
-        "success": None
-    })
+        "success": SETTINGS_SAVED_MESSAGE if saved else None # Set by the redirect after a successful save
+    }, headers=cache_headers)
 
 @router.post("/settings", name="ui_update_mcpo_settings")
 async def handle_update_mcpo_settings_form(
@@ -43,6 +70,8 @@ async def handle_update_mcpo_settings_form(
     health_check_interval_seconds: Optional[int] = Form(None),
     health_check_failure_attempts: Optional[int] = Form(None),
     health_check_failure_retry_delay_seconds: Optional[int] = Form(None),
+    health_check_backoff_base: Optional[float] = Form(None),
+    health_check_max_backoff_seconds: Optional[int] = Form(None),
     auto_restart_on_failure: bool = Form(False)
     # manual_config_mode_enabled is NOT taken from this form anymore
 ):
@@ -51,27 +80,30 @@ async def handle_update_mcpo_settings_form(
     logger.info("UI Request: POST /settings (Updating subset of MCPO settings)")
 
     error_msg: Optional[str] = None
-    success_msg: Optional[str] = None
 
     # Load current settings to preserve manual_config_mode_enabled and provide defaults
     current_settings = config_service.load_mcpo_settings()
 
-    form_data_to_display = { # This will be updated with validated data if successful
-        "port": port,
-        "public_base_url": public_base_url,
-        "api_key": api_key,
-        "use_api_key": use_api_key,
-        "config_file_path": config_file_path,
-        "log_file_path": log_file_path,
-        "log_auto_refresh_enabled": log_auto_refresh_enabled,
-        "log_auto_refresh_interval_seconds": log_auto_refresh_interval_seconds,
-        "health_check_enabled": health_check_enabled,
-        "health_check_interval_seconds": health_check_interval_seconds,
-        "health_check_failure_attempts": health_check_failure_attempts,
-        "health_check_failure_retry_delay_seconds": health_check_failure_retry_delay_seconds,
-        "auto_restart_on_failure": auto_restart_on_failure,
-        "manual_config_mode_enabled": current_settings.manual_config_mode_enabled # Preserve this
-    }
+    # A successful save redirects; the raw submission is only assembled when re-displaying after an error
+    def submitted_form_data() -> Dict[str, Any]:
+        return {
+            "port": port,
+            "public_base_url": public_base_url,
+            "api_key": api_key,
+            "use_api_key": use_api_key,
+            "config_file_path": config_file_path,
+            "log_file_path": log_file_path,
+            "log_auto_refresh_enabled": log_auto_refresh_enabled,
+            "log_auto_refresh_interval_seconds": log_auto_refresh_interval_seconds,
+            "health_check_enabled": health_check_enabled,
+            "health_check_interval_seconds": health_check_interval_seconds,
+            "health_check_failure_attempts": health_check_failure_attempts,
+            "health_check_failure_retry_delay_seconds": health_check_failure_retry_delay_seconds,
+            "health_check_backoff_base": health_check_backoff_base,
+            "health_check_max_backoff_seconds": health_check_max_backoff_seconds,
+            "auto_restart_on_failure": auto_restart_on_failure,
+            "manual_config_mode_enabled": current_settings.manual_config_mode_enabled # Preserve this
+        }
 
     try:
         clean_api_key = api_key if api_key and api_key.strip() else None
@@ -91,6 +123,15 @@ async def handle_update_mcpo_settings_form(
         hc_retry_delay = health_check_failure_retry_delay_seconds
         if health_check_failure_retry_delay_seconds is None or not health_check_enabled:
             hc_retry_delay = model_defaults['health_check_failure_retry_delay_seconds'].default
+
+        # Disabled inputs are not submitted; keep the stored backoff values in that case
+        hc_backoff_base = health_check_backoff_base
+        if health_check_backoff_base is None or not health_check_enabled:
+            hc_backoff_base = current_settings.health_check_backoff_base
+
+        hc_max_backoff = health_check_max_backoff_seconds
+        if health_check_max_backoff_seconds is None or not health_check_enabled:
+            hc_max_backoff = current_settings.health_check_max_backoff_seconds
             
         current_auto_restart = auto_restart_on_failure
         if not health_check_enabled:
@@ -109,24 +150,29 @@ async def handle_update_mcpo_settings_form(
             health_check_interval_seconds=hc_interval,
             health_check_failure_attempts=hc_attempts,
             health_check_failure_retry_delay_seconds=hc_retry_delay,
+            health_check_backoff_base=hc_backoff_base,
+            health_check_max_backoff_seconds=hc_max_backoff,
             auto_restart_on_failure=current_auto_restart,
             # Preserve the manual_config_mode_enabled from currently loaded settings
             manual_config_mode_enabled=current_settings.manual_config_mode_enabled
         )
 
-        if config_service.save_mcpo_settings(settings_for_validation):
-            success_msg = "MCPO settings successfully updated."
-            logger.info(success_msg)
-            form_data_to_display = settings_for_validation.model_dump() # Display the newly saved data
+        if await run_in_threadpool(config_service.save_mcpo_settings, settings_for_validation):
+            logger.info(SETTINGS_SAVED_MESSAGE)
+            mcpo_service.wake_health_check() # Apply new health check settings without waiting a full interval
+            # Post/Redirect/Get: the GET page shows the saved values and can be answered from the browser cache
+            redirect_url = str(url_for_cached(request, "ui_edit_mcpo_settings_form").include_query_params(saved=1))
+            return RedirectResponse(url=redirect_url, status_code=303)
         else:
             error_msg = "Failed to save MCPO settings."
             logger.error(error_msg)
 
     except ValidationError as ve:
-        logger.warning(f"Validation error when updating MCPO settings: {ve.errors(include_url=False)}")
+        validation_errors = ve.errors(include_url=False, include_input=False) # Once, for both the log and the message; inputs may hold the API key
+        logger.warning(f"Validation error when updating MCPO settings: {validation_errors}")
         error_details = [
             f"Field '{'.'.join(map(str, e['loc'])) if e['loc'] else 'field'}': {e['msg']}"
-            for e in ve.errors(include_url=False)
+            for e in validation_errors
         ]
         error_msg = "Validation errors: " + "; ".join(error_details)
     except Exception as e:
@@ -135,5 +181,9 @@ async def handle_update_mcpo_settings_form(
 
     return templates.TemplateResponse(
         "mcpo_settings_form.html",
-        {"request": request, "settings": form_data_to_display, "error": error_msg, "success": success_msg}
+        {
+            "request": request,
+            "settings": submitted_form_data(),
+            "error": error_msg, "success": None,
+        }
     )
\ No newline at end of file
@@ -0,0 +1,44 @@
+# mcpo_control_panel/ui/routes/urls.py
+import logging
+from typing import Any, Dict, Tuple
+
+from jinja2 import pass_context
+from starlette.datastructures import URL, URLPath
+from starlette.requests import Request
+
+logger = logging.getLogger(__name__)
+
+URL_PATH_CACHE_SIZE = 1024 # Route name + path params; covers per-server row links on the index page
+
+# Starlette routers define __eq__ without __hash__, so entries are keyed by id() and keep the
+# router next to the path to guard against a reused id.
+_url_path_cache: Dict[tuple, Tuple[Any, URLPath]] = {}
+
+def _url_path_for(url_path_provider: Any, name: str, path_params: Dict[str, Any]) -> URLPath:
+    key = (id(url_path_provider), name, tuple(sorted(path_params.items())))
+    entry = _url_path_cache.get(key)
+    if entry is not None and entry[0] is url_path_provider:
+        return entry[1]
+    url_path = url_path_provider.url_path_for(name, **path_params)
+    if len(_url_path_cache) >= URL_PATH_CACHE_SIZE:
+        _url_path_cache.clear()
+    _url_path_cache[key] = (url_path_provider, url_path)
+    return url_path
+
+def url_for_cached(request: Request, name: str, /, **path_params: Any) -> URL:
+    """
+    Same result as request.url_for(), but the route lookup (a linear scan over every mounted
+    route) is memoised per route name and path params. The base URL is still taken from the
+    request, so root_path and Host handling are unchanged.
+    """
+    url_path_provider = request.scope.get("router") or request.scope.get("app")
+    try:
+        url_path = _url_path_for(url_path_provider, name, path_params)
+    except TypeError: # Unhashable path param; resolve without the cache
+        return request.url_for(name, **path_params)
+    return url_path.make_absolute_url(base_url=request.base_url)
+
+@pass_context
+def jinja_url_for(context: dict, name: str, /, **path_params: Any) -> URL:
+    """Drop-in for the url_for global that Jinja2Templates installs."""
+    return url_for_cached(context["request"], name, **path_params)